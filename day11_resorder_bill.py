@@ -1,12 +1,13 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import io
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+
+from invoice_render import render_pdf
+from kitchen_queue import NORMAL, RUSH, start_background_kitchen
+from order_store import (Order, get_hourly_revenue, get_recent_orders, get_sales_summary,
+                         get_top_items, init_order_db, save_order)
+from profiler import render_timing_panel, timed
+from restaurant_menu import ITEM_CATEGORY, MENU, TAX_RATE, search_menu
 
 # Configure page
 st.set_page_config(page_title="Restaurant Order & Billing App 🍔", layout="wide")
@@ -16,55 +17,14 @@ if 'cart' not in st.session_state:
     st.session_state.cart = {}
 if 'order_history' not in st.session_state:
     st.session_state.order_history = []
+if 'menu_version' not in st.session_state:
+    st.session_state.menu_version = 0
+if 'cart_updated_at' not in st.session_state:
+    st.session_state.cart_updated_at = datetime.now().isoformat(timespec='seconds')
 
-# Restaurant menu data
-MENU = {
-    "🍔 Burgers": {
-        "Classic Burger": 12.99,
-        "Cheeseburger": 14.99,
-        "Bacon Deluxe": 16.99,
-        "Veggie Burger": 13.99,
-        "Double Whopper": 19.99
-    },
-    "🍕 Pizza": {
-        "Margherita": 15.99,
-        "Pepperoni": 17.99,
-        "Supreme": 21.99,
-        "Hawaiian": 18.99,
-        "Veggie Delight": 19.99
-    },
-    "🍝 Pasta": {
-        "Spaghetti Carbonara": 16.99,
-        "Chicken Alfredo": 18.99,
-        "Penne Arrabbiata": 15.99,
-        "Lasagna": 19.99,
-        "Seafood Linguine": 22.99
-    },
-    "🥗 Salads": {
-        "Caesar Salad": 11.99,
-        "Greek Salad": 12.99,
-        "Cobb Salad": 14.99,
-        "Quinoa Bowl": 13.99,
-        "Garden Fresh": 10.99
-    },
-    "🥤 Beverages": {
-        "Soft Drink": 2.99,
-        "Fresh Juice": 4.99,
-        "Coffee": 3.99,
-        "Beer": 5.99,
-        "Wine (Glass)": 7.99
-    },
-    "🍰 Desserts": {
-        "Chocolate Cake": 7.99,
-        "Tiramisu": 8.99,
-        "Ice Cream": 5.99,
-        "Cheesecake": 8.99,
-        "Apple Pie": 6.99
-    }
-}
-
-# Tax rate (adjustable)
-TAX_RATE = 0.08  # 8%
+def touch_cart():
+    """Stamp the cart's last change; invoices are dated (and cached) by it"""
+    st.session_state.cart_updated_at = datetime.now().isoformat(timespec='seconds')
 
 def add_to_cart(item, price, quantity):
     """Add item to cart"""
@@ -73,162 +33,232 @@ def add_to_cart(item, price, quantity):
             st.session_state.cart[item]['quantity'] += quantity
         else:
             st.session_state.cart[item] = {'price': price, 'quantity': quantity}
+        touch_cart()
 
 def remove_from_cart(item):
     """Remove item from cart"""
     if item in st.session_state.cart:
         del st.session_state.cart[item]
+        touch_cart()
+
+def cart_lines():
+    """Hashable snapshot of the cart: ((item, price, quantity), ...)"""
+    return tuple((item, details['price'], details['quantity'])
+                 for item, details in st.session_state.cart.items())
+
+def totals_for(lines, tax_rate):
+    """Subtotal, tax, and total for cart lines, computed exactly in cents"""
+    return Order(lines, tax_rate).totals()
 
 def calculate_totals():
     """Calculate subtotal, tax, and total"""
-    subtotal = sum(item['price'] * item['quantity'] for item in st.session_state.cart.values())
-    tax = subtotal * TAX_RATE
-    total = subtotal + tax
-    return subtotal, tax, total
+    return totals_for(cart_lines(), TAX_RATE)
 
-def generate_csv():
+# Invoices are memoized on the cart contents and tax rate, so reruns from menu
+# clicks reuse the last build; the least recently used entries are evicted
+INVOICE_CACHE_ENTRIES = 32
+
+@st.cache_data(max_entries=INVOICE_CACHE_ENTRIES, show_spinner=False)
+@timed("invoice.generate_csv")
+def generate_csv(lines, tax_rate):
     """Generate CSV invoice"""
-    if not st.session_state.cart:
+    if not lines:
         return None
     
-    subtotal, tax, total = calculate_totals()
+    order = Order(lines, tax_rate)
+    subtotal, tax, total = order.totals()
     
     # Create order data
     order_data = []
-    for item, details in st.session_state.cart.items():
+    for (item, price, quantity), line_cents in zip(lines, order.line_totals_cents()):
         order_data.append({
             'Item': item,
-            'Price': f"${details['price']:.2f}",
-            'Quantity': details['quantity'],
-            'Subtotal': f"${details['price'] * details['quantity']:.2f}"
+            'Price': f"${price:.2f}",
+            'Quantity': quantity,
+            'Subtotal': f"${line_cents / 100:.2f}"
         })
     
     # Add summary rows
     order_data.append({'Item': '', 'Price': '', 'Quantity': '', 'Subtotal': ''})
     order_data.append({'Item': 'Subtotal', 'Price': '', 'Quantity': '', 'Subtotal': f"${subtotal:.2f}"})
-    order_data.append({'Item': f'Tax ({TAX_RATE*100}%)', 'Price': '', 'Quantity': '', 'Subtotal': f"${tax:.2f}"})
+    order_data.append({'Item': f'Tax ({tax_rate*100}%)', 'Price': '', 'Quantity': '', 'Subtotal': f"${tax:.2f}"})
     order_data.append({'Item': 'TOTAL', 'Price': '', 'Quantity': '', 'Subtotal': f"${total:.2f}"})
     
     df = pd.DataFrame(order_data)
     return df.to_csv(index=False)
 
-def generate_pdf():
-    """Generate PDF invoice"""
-    if not st.session_state.cart:
+@st.cache_data(max_entries=INVOICE_CACHE_ENTRIES, show_spinner=False)
+@timed("invoice.generate_pdf")
+def generate_pdf(lines, tax_rate, created_at):
+    """Generate PDF invoice bytes dated created_at (part of the cache key, so no stale dates)"""
+    if not lines:
         return None
-    
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    story = []
-    
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=1  # Center alignment
+    return render_pdf(Order(lines, tax_rate, created_at))
+
+@st.cache_data
+def menu_table(rows):
+    """Editable menu rows: Item, Price and a Qty column starting at 0"""
+    return pd.DataFrame(
+        {'Item': [item for item, _ in rows], 'Price': [price for _, price in rows], 'Qty': 0}
     )
+
+def menu_editor(rows, key):
+    """One data_editor for a list of (item, price); return the edited table"""
+    return st.data_editor(
+        menu_table(tuple(rows)),
+        key=f"{key}_{st.session_state.menu_version}",
+        hide_index=True,
+        use_container_width=True,
+        disabled=['Item', 'Price'],
+        column_config={
+            'Price': st.column_config.NumberColumn(format="$%.2f"),
+            'Qty': st.column_config.NumberColumn(min_value=0, max_value=10, step=1),
+        },
+    )
+
+def render_menu():
+    """Menu as one editable table per category (or per search), plus one add button"""
+    query = st.text_input("🔍 Search menu", placeholder="e.g. pizza")
     
-    # Header
-    story.append(Paragraph("🍔 Restaurant Invoice", title_style))
-    story.append(Paragraph(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-    story.append(Spacer(1, 20))
-    
-    # Order details
-    subtotal, tax, total = calculate_totals()
-    
-    # Create table data
-    table_data = [['Item', 'Price', 'Qty', 'Subtotal']]
+    if query:
+        matches = search_menu(query)
+        if not matches:
+            st.caption("No menu items match your search.")
+            return
+        tables = [menu_editor([(item, price) for item, _, price in matches], "menu_search")]
+    else:
+        tables = []
+        for tab, (category, items) in zip(st.tabs(list(MENU)), MENU.items()):
+            with tab:
+                tables.append(menu_editor(items.items(), f"menu_{category}"))
     
-    for item, details in st.session_state.cart.items():
-        table_data.append([
-            item,
-            f"${details['price']:.2f}",
-            str(details['quantity']),
-            f"${details['price'] * details['quantity']:.2f}"
-        ])
+    selected = [
+        (row.Item, float(row.Price), int(row.Qty))
+        for table in tables
+        for row in table[table['Qty'] > 0].itertuples()
+    ]
+    if st.button("🛒 Add to Cart", type="primary", disabled=not selected):
+        for item, price, quantity in selected:
+            add_to_cart(item, price, quantity)
+        st.session_state.menu_version += 1  # Fresh editors with quantities back at 0
+        st.toast(f"Added {sum(quantity for _, _, quantity in selected)} item(s) to cart!")
+        st.rerun()
+
+@st.cache_resource
+def get_kitchen():
+    """One kitchen queue for the whole server, running on its own event loop thread"""
+    return start_background_kitchen()
+
+def checkout(rush=False):
+    """Store the cart as an order, send it to the kitchen and start a new one"""
+    lines = cart_lines()
+    order_id = save_order(lines, TAX_RATE, ITEM_CATEGORY)
+    get_kitchen().submit_threadsafe(order_id, lines, RUSH if rush else NORMAL)
+    st.session_state.order_history.append(order_id)
+    st.session_state.cart = {}
+    touch_cart()
+    return order_id
+
+@st.fragment(run_every=2)
+def kitchen_board():
+    rows = get_kitchen().summary_threadsafe()
+    cols = st.columns(len(rows))
+    for col, row in zip(cols, rows):
+        col.metric(row['station'].title(), f"{row['queued']} queued", f"{row['completed']} done", delta_color="off")
+    st.dataframe(rows, hide_index=True, use_container_width=True,
+                 column_config={column: st.column_config.NumberColumn(format="%.1f")
+                                for column in ('tickets/hour', 'utilisation %', 'wait p50 min',
+                                               'wait p95 min', 'ticket p95 min')})
+
+def kitchen_page():
+    st.header("👨‍🍳 Kitchen Queue")
+    st.caption("Checked-out orders are split into tickets and routed to stations by menu category. "
+               "Rush orders are picked up first.")
+    kitchen_board()
+
+def sales_dashboard_page():
+    st.header("📊 Sales Dashboard")
     
-    # Add summary rows
-    table_data.append(['', '', '', ''])
-    table_data.append(['Subtotal', '', '', f"${subtotal:.2f}"])
-    table_data.append([f'Tax ({TAX_RATE*100}%)', '', '', f"${tax:.2f}"])
-    table_data.append(['TOTAL', '', '', f"${total:.2f}"])
+    orders, revenue, average_ticket = get_sales_summary()
+    if not orders:
+        st.info("No orders yet. Check out a cart to start collecting sales data!")
+        return
     
-    # Create table
-    table = Table(table_data, colWidths=[3*inch, 1*inch, 0.5*inch, 1*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, -1), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Orders", f"{orders:,}")
+    col2.metric("Revenue (pre-tax)", f"${revenue:,.2f}")
+    col3.metric("Average Ticket", f"${average_ticket:,.2f}")
     
-    story.append(table)
-    doc.build(story)
+    st.subheader("🕒 Revenue per Hour")
+    days = st.slider("Days to show", 1, 90, 7)
+    since = (datetime.now() - pd.Timedelta(days=days)).strftime('%Y-%m-%dT%H')
+    hourly = pd.DataFrame(get_hourly_revenue(since), columns=['Hour', 'Orders', 'Items', 'Revenue'])
+    if hourly.empty:
+        st.caption("No orders in this period.")
+    else:
+        hourly['Hour'] = pd.to_datetime(hourly['Hour'], format='%Y-%m-%dT%H')
+        st.bar_chart(hourly, x='Hour', y='Revenue')
     
-    buffer.seek(0)
-    return buffer
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("🏆 Top Items")
+        top_items = pd.DataFrame(get_top_items(10), columns=['Item', 'Category', 'Quantity', 'Revenue'])
+        st.dataframe(top_items, hide_index=True, use_container_width=True,
+                     column_config={'Revenue': st.column_config.NumberColumn(format="$%.2f")})
+    with col2:
+        st.subheader("🧾 Recent Orders")
+        recent = pd.DataFrame(get_recent_orders(10), columns=['Order', 'Time', 'Items', 'Total'])
+        st.dataframe(recent, hide_index=True, use_container_width=True,
+                     column_config={'Total': st.column_config.NumberColumn(format="$%.2f")})
 
 # Main app
 def main():
+    init_order_db()
+    
     st.title("🍔 Restaurant Order & Billing App")
     st.markdown("---")
     
+    page = st.sidebar.radio("Page", ["Order", "Kitchen", "Sales Dashboard"])
+    if page == "Kitchen":
+        kitchen_page()
+    elif page == "Sales Dashboard":
+        sales_dashboard_page()
+    else:
+        order_page()
+    
+    render_timing_panel(title="⏱️ Invoice Timings")
+    
+    # Footer
+    st.markdown("---")
+    st.markdown(
+        """
+        <div style='text-align: center; color: #666;'>
+        🍔 Restaurant Order & Billing App | Made with Streamlit
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+def order_page():
     # Create two columns
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.header("📋 Menu")
         
-        # Display menu by category
-        for category, items in MENU.items():
-            st.subheader(category)
-            
-            # Create columns for each item in the category
-            item_cols = st.columns(len(items))
-            
-            for idx, (item, price) in enumerate(items.items()):
-                with item_cols[idx]:
-                    st.write(f"**{item}**")
-                    st.write(f"${price:.2f}")
-                    
-                    # Quantity selector
-                    quantity = st.number_input(
-                        f"Qty",
-                        min_value=0,
-                        max_value=10,
-                        value=0,
-                        key=f"{item}_qty",
-                        help=f"Add {item} to cart"
-                    )
-                    
-                    # Add to cart button
-                    if st.button(f"Add to Cart", key=f"{item}_btn"):
-                        if quantity > 0:
-                            add_to_cart(item, price, quantity)
-                            st.success(f"Added {quantity}x {item} to cart!")
-                            st.rerun()
-            
-            st.markdown("---")
+        render_menu()
     
     with col2:
         st.header("🛒 Your Order")
         
         if st.session_state.cart:
-            # Display cart items
-            for item, details in st.session_state.cart.items():
+            # Display cart items (line totals priced in cents like the bill)
+            line_totals = Order(cart_lines(), TAX_RATE).line_totals_cents()
+            for (item, details), line_cents in zip(st.session_state.cart.items(), line_totals):
                 col_item, col_remove = st.columns([3, 1])
                 with col_item:
                     st.write(f"**{item}**")
-                    st.write(f"${details['price']:.2f} × {details['quantity']} = ${details['price'] * details['quantity']:.2f}")
+                    st.write(f"${details['price']:.2f} × {details['quantity']} = ${line_cents / 100:.2f}")
                 with col_remove:
                     if st.button("❌", key=f"remove_{item}", help=f"Remove {item}"):
                         remove_from_cart(item)
@@ -251,9 +281,10 @@ def main():
             st.subheader("📥 Download Invoice")
             
             col_csv, col_pdf = st.columns(2)
+            lines = cart_lines()
             
             with col_csv:
-                csv_data = generate_csv()
+                csv_data = generate_csv(lines, TAX_RATE)
                 if csv_data:
                     st.download_button(
                         label="📄 Download CSV",
@@ -263,34 +294,35 @@ def main():
                     )
             
             with col_pdf:
-                pdf_data = generate_pdf()
+                pdf_data = generate_pdf(lines, TAX_RATE, st.session_state.cart_updated_at)
                 if pdf_data:
                     st.download_button(
                         label="📑 Download PDF",
-                        data=pdf_data.getvalue(),
+                        data=pdf_data,
                         file_name=f"invoice_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                         mime="application/pdf"
                     )
             
-            # Clear cart button
+            # Checkout / clear cart buttons
             st.markdown("---")
-            if st.button("🗑️ Clear Cart", type="secondary"):
-                st.session_state.cart = {}
-                st.rerun()
+            rush = st.toggle("🚨 Rush order")
+            col_checkout, col_clear = st.columns(2)
+            with col_checkout:
+                if st.button("✅ Checkout", type="primary"):
+                    order_id = checkout(rush)
+                    st.toast(f"Order #{order_id} placed!")
+                    st.rerun()
+            with col_clear:
+                if st.button("🗑️ Clear Cart", type="secondary"):
+                    st.session_state.cart = {}
+                    touch_cart()
+                    st.rerun()
                 
         else:
             st.info("Your cart is empty. Add some items from the menu!")
-    
-    # Footer
-    st.markdown("---")
-    st.markdown(
-        """
-        <div style='text-align: center; color: #666;'>
-        🍔 Restaurant Order & Billing App | Made with Streamlit
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+            if st.session_state.order_history:
+                st.caption(f"Orders placed this session: "
+                           f"{', '.join(f'#{order_id}' for order_id in st.session_state.order_history)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,94 +1,105 @@
 import streamlit as st
-import random
-import time
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from tictactoe_ai import DIFFICULTY_LEVELS, choose_move
+from tictactoe_engine import Board, apply_computer_move, make_move as engine_make_move
+from gomoku_engine import BOARD_VARIANTS, GridBoard, choose_grid_move, seed_worker
+
+# Seconds before the computer's mark shows up. This is a browser-side animation,
+# so no server thread waits while the computer "thinks".
+THINKING_DELAY = 0.5
+
+def new_board(variant):
+    """Create an empty board: the bitboard for 3×3, the generalised engine otherwise"""
+    size, k = BOARD_VARIANTS[variant]
+    if (size, k) == (3, 3):
+        return Board()
+    return GridBoard(size, k)
 
 # Initialize session state
+if 'board_variant' not in st.session_state:
+    st.session_state.board_variant = 'Classic 3×3'
 if 'board' not in st.session_state:
-    st.session_state.board = [['' for _ in range(3)] for _ in range(3)]
+    st.session_state.board = new_board(st.session_state.board_variant)
 if 'current_player' not in st.session_state:
     st.session_state.current_player = 'X'
 if 'game_mode' not in st.session_state:
     st.session_state.game_mode = 'Two Player'
+if 'difficulty' not in st.session_state:
+    st.session_state.difficulty = 'Easy'
 if 'game_over' not in st.session_state:
     st.session_state.game_over = False
 if 'winner' not in st.session_state:
     st.session_state.winner = None
 if 'winning_line' not in st.session_state:
     st.session_state.winning_line = []
+if 'pending_move' not in st.session_state:
+    st.session_state.pending_move = None
+if 'reveal_move' not in st.session_state:
+    st.session_state.reveal_move = None
 
-def check_winner(board):
-    """Check for a winner and return the winner and winning line coordinates"""
-    # Check rows
-    for i in range(3):
-        if board[i][0] == board[i][1] == board[i][2] != '':
-            return board[i][0], [(i, 0), (i, 1), (i, 2)]
-    
-    # Check columns
-    for j in range(3):
-        if board[0][j] == board[1][j] == board[2][j] != '':
-            return board[0][j], [(0, j), (1, j), (2, j)]
-    
-    # Check diagonals
-    if board[0][0] == board[1][1] == board[2][2] != '':
-        return board[0][0], [(0, 0), (1, 1), (2, 2)]
-    
-    if board[0][2] == board[1][1] == board[2][0] != '':
-        return board[0][2], [(0, 2), (1, 1), (2, 0)]
-    
-    return None, []
+@st.cache_resource
+def get_search_pool():
+    """Worker processes for large-board searches, shared by all sessions
 
-def is_board_full(board):
-    """Check if the board is full"""
-    return all(board[i][j] != '' for i in range(3) for j in range(3))
+    Workers are spawned rather than forked: forking the multi-threaded server
+    can deadlock on locks held by other threads.
+    """
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn'),
+                               initializer=seed_worker)
 
-def get_computer_move(board):
-    """Get a random move for the computer"""
-    empty_cells = [(i, j) for i in range(3) for j in range(3) if board[i][j] == '']
-    return random.choice(empty_cells) if empty_cells else None
+def get_computer_move(board, difficulty='Easy'):
+    """Get the computer's move for the selected difficulty"""
+    if isinstance(board, GridBoard):
+        # Larger boards can't be solved ahead, so search within a time budget
+        return choose_grid_move(board, DIFFICULTY_LEVELS[difficulty])
+    return choose_move(board, difficulty)
 
 def make_move(row, col):
     """Make a move on the board"""
-    if st.session_state.board[row][col] == '' and not st.session_state.game_over:
-        st.session_state.board[row][col] = st.session_state.current_player
-        
-        # Check for winner
-        winner, winning_line = check_winner(st.session_state.board)
-        if winner:
-            st.session_state.winner = winner
-            st.session_state.winning_line = winning_line
-            st.session_state.game_over = True
-        elif is_board_full(st.session_state.board):
-            st.session_state.game_over = True
-            st.session_state.winner = "Tie"
-        else:
-            # Switch player
-            if st.session_state.game_mode == 'Two Player':
-                st.session_state.current_player = 'O' if st.session_state.current_player == 'X' else 'X'
-            elif st.session_state.game_mode == 'vs Computer' and st.session_state.current_player == 'X':
-                st.session_state.current_player = 'O'
-                # Computer makes a move
-                computer_move = get_computer_move(st.session_state.board)
-                if computer_move and not st.session_state.game_over:
-                    time.sleep(0.5)  # Small delay for better UX
-                    comp_row, comp_col = computer_move
-                    st.session_state.board[comp_row][comp_col] = 'O'
-                    
-                    # Check for winner after computer move
-                    winner, winning_line = check_winner(st.session_state.board)
-                    if winner:
-                        st.session_state.winner = winner
-                        st.session_state.winning_line = winning_line
-                        st.session_state.game_over = True
-                    elif is_board_full(st.session_state.board):
-                        st.session_state.game_over = True
-                        st.session_state.winner = "Tie"
-                    else:
-                        st.session_state.current_player = 'X'
+    vs_computer = st.session_state.game_mode == 'vs Computer'
+    if vs_computer and st.session_state.current_player != 'X':
+        return  # Still waiting for the computer
+    if not engine_make_move(st.session_state, row, col) or not vs_computer or st.session_state.game_over:
+        return
+
+    board = st.session_state.board
+    if isinstance(board, GridBoard):
+        # A search uses its whole time budget, so run it off the script thread
+        st.session_state.pending_move = get_search_pool().submit(
+            choose_grid_move, board, DIFFICULTY_LEVELS[st.session_state.difficulty]
+        )
+    else:
+        # A 3×3 move is a table lookup; the delay is shown by the browser
+        computer_move = get_computer_move(board, st.session_state.difficulty)
+        apply_computer_move(st.session_state, computer_move)
+        st.session_state.reveal_move = computer_move
+
+@st.fragment(run_every=0.25)
+def poll_computer_move():
+    """Apply the computer's move once the background search has finished"""
+    future = st.session_state.pending_move
+    if future is not None and future.done():
+        st.session_state.pending_move = None
+        try:
+            computer_move = future.result()
+        except Exception:
+            # A crashed worker mustn't leave the player waiting forever: play a random move
+            st.toast("⚠️ The computer's search failed, so it played a random move.")
+            computer_move = choose_grid_move(st.session_state.board, 0.0)
+        apply_computer_move(st.session_state, computer_move)
+        st.rerun()
 
 def reset_game():
     """Reset the game to initial state"""
-    st.session_state.board = [['' for _ in range(3)] for _ in range(3)]
+    st.session_state.board = new_board(st.session_state.board_variant)
     st.session_state.current_player = 'X'
+    if st.session_state.pending_move is not None:
+        st.session_state.pending_move.cancel()
+    st.session_state.pending_move = None
+    st.session_state.reveal_move = None
     st.session_state.game_over = False
     st.session_state.winner = None
     st.session_state.winning_line = []
@@ -123,7 +134,26 @@ with col1:
         st.session_state.game_mode = game_mode
         reset_game()
 
+    if st.session_state.game_mode == 'vs Computer':
+        difficulty = st.selectbox(
+            "🧠 Difficulty:",
+            list(DIFFICULTY_LEVELS),
+            index=list(DIFFICULTY_LEVELS).index(st.session_state.difficulty)
+        )
+        if difficulty != st.session_state.difficulty:
+            st.session_state.difficulty = difficulty
+            reset_game()
+
 with col2:
+    board_variant = st.selectbox(
+        "🧩 Board:",
+        list(BOARD_VARIANTS),
+        index=list(BOARD_VARIANTS).index(st.session_state.board_variant)
+    )
+    if board_variant != st.session_state.board_variant:
+        st.session_state.board_variant = board_variant
+        reset_game()
+
     if st.button("🔄 Reset Game", use_container_width=True):
         reset_game()
         st.rerun()
@@ -154,26 +184,48 @@ if st.session_state.game_over:
 # Game board
 st.markdown("### 🎲 Game Board")
 
+board_size = BOARD_VARIANTS[st.session_state.board_variant][0]
+cell_height = 80 if board_size <= 3 else max(28, 240 // board_size)
+
 # Custom CSS for buttons
-st.markdown("""
+st.markdown(f"""
 <style>
-.stButton > button {
+.stButton > button {{
     width: 100%;
-    height: 80px;
-    font-size: 24px;
+    height: {cell_height}px;
+    font-size: {24 if board_size <= 5 else 14}px;
     font-weight: bold;
     border-radius: 10px;
     margin: 2px;
-}
+}}
 </style>
 """, unsafe_allow_html=True)
 
-# Create the 3x3 grid
-for i in range(3):
-    cols = st.columns(3)
-    for j in range(3):
+# Fade in the computer's latest mark after the thinking delay (this render only)
+if st.session_state.reveal_move:
+    reveal_row, reveal_col = st.session_state.reveal_move
+    st.markdown(f"""
+    <style>
+    .st-key-btn_{reveal_row}_{reveal_col} button {{
+        animation: computer-thinking {THINKING_DELAY}s steps(1, end);
+    }}
+    @keyframes computer-thinking {{
+        from {{ color: transparent; }}
+    }}
+    </style>
+    """, unsafe_allow_html=True)
+    st.session_state.reveal_move = None
+
+if st.session_state.pending_move is not None:
+    poll_computer_move()
+
+# Create the grid
+rows = st.session_state.board.to_rows()
+for i in range(board_size):
+    cols = st.columns(board_size)
+    for j in range(board_size):
         with cols[j]:
-            button_text = st.session_state.board[i][j] if st.session_state.board[i][j] else " "
+            button_text = rows[i][j] if rows[i][j] else " "
             button_style = get_button_style(i, j)
             
             # Create button with custom styling
@@ -195,8 +247,7 @@ with col1:
     st.metric("🎮 Game Mode", st.session_state.game_mode)
 
 with col2:
-    moves_made = sum(1 for i in range(3) for j in range(3) if st.session_state.board[i][j] != '')
-    st.metric("📈 Moves Made", moves_made)
+    st.metric("📈 Moves Made", st.session_state.board.moves)
 
 with col3:
     if st.session_state.game_over:
@@ -212,13 +263,16 @@ with col3:
 with st.expander("📋 How to Play"):
     st.markdown("""
     **Tic-Tac-Toe Rules:**
-    - Players take turns placing X's and O's on a 3×3 grid
-    - The first player to get 3 of their marks in a row (horizontally, vertically, or diagonally) wins
-    - If all 9 squares are filled and no player has won, it's a tie
+    - Players take turns placing X's and O's on the grid (3×3 in the classic game)
+    - The first player to get enough marks in a row (horizontally, vertically, or diagonally) wins: 3 on the classic board, as shown in the board name otherwise
+    - If every square is filled and no player has won, it's a tie
     
     **Game Modes:**
     - **Two Player**: Play against a friend on the same device
-    - **vs Computer**: Play against the computer (makes random moves)
+    - **vs Computer**: Play against the computer
+        - **Easy**: random moves
+        - **Medium / Hard**: a mix of random and perfect moves
+        - **Unbeatable**: perfect play, the best you can get is a tie
     
     **Features:**
     - Winning combinations are highlighted in green
@@ -1,6 +1,22 @@
 import streamlit as st
 import random
 
+from rps_ai import MarkovPredictor, adaptive_choice, max_order
+from rps_engine import CLASSIC, VARIANTS, determine_winner, win_rates
+from rps_history import RoundHistory
+
+# Variants with more moves than this get a picker instead of one button per move
+MAX_MOVE_BUTTONS = 15
+
+@st.cache_resource
+def get_history(variant_name):
+    """Lifetime round log for a variant, shared by every session"""
+    return RoundHistory(VARIANTS[variant_name])
+
+def new_predictor(variant):
+    """Fresh adaptive model sized for the variant"""
+    return MarkovPredictor(max_order(variant.size), variant.size)
+
 # Initialize session state for scores
 if 'user_score' not in st.session_state:
     st.session_state.user_score = 0
@@ -8,40 +24,73 @@ if 'computer_score' not in st.session_state:
     st.session_state.computer_score = 0
 if 'games_played' not in st.session_state:
     st.session_state.games_played = 0
+if 'opponent' not in st.session_state:
+    st.session_state.opponent = 'Random'
+if 'variant' not in st.session_state:
+    st.session_state.variant = CLASSIC.name
+if 'predictor' not in st.session_state:
+    st.session_state.predictor = new_predictor(CLASSIC)
 
-def get_computer_choice():
-    """Generate random computer choice"""
-    return random.choice(['Rock', 'Paper', 'Scissors'])
+def get_computer_choice(variant):
+    """Generate the computer choice for the selected opponent"""
+    if st.session_state.opponent == 'Adaptive':
+        return adaptive_choice(st.session_state.predictor, variant)
+    return random.choice(variant.moves)
 
-def determine_winner(user_choice, computer_choice):
-    """Determine the winner of the game"""
-    if user_choice == computer_choice:
-        return 'tie'
+def get_emoji(choice, variant=CLASSIC):
+    """Return emoji for each choice"""
+    return variant.emoji(choice)
+
+def play_round(user_choice, variant):
+    """Play one round against the computer and update the scores"""
+    computer_choice = get_computer_choice(variant)
+    result = determine_winner(user_choice, computer_choice, variant)
+    st.session_state.predictor.observe(variant.move_index[user_choice])
+    get_history(variant.name).record(variant.move_index[user_choice], variant.move_index[computer_choice])
     
-    winning_combinations = {
-        'Rock': 'Scissors',
-        'Paper': 'Rock', 
-        'Scissors': 'Paper'
-    }
+    # Update game state
+    st.session_state.games_played += 1
+    if result == 'user':
+        st.session_state.user_score += 1
+    elif result == 'computer':
+        st.session_state.computer_score += 1
     
-    if winning_combinations[user_choice] == computer_choice:
-        return 'user'
-    else:
-        return 'computer'
-
-def get_emoji(choice):
-    """Return emoji for each choice"""
-    emojis = {
-        'Rock': '🪨',
-        'Paper': '📄',
-        'Scissors': '✂️'
-    }
-    return emojis.get(choice, '')
+    # Store choices for display
+    st.session_state.last_user_choice = user_choice
+    st.session_state.last_computer_choice = computer_choice
+    st.session_state.last_result = result
 
 # Main app
 st.title("🎮 Rock, Paper, Scissors")
 st.write("Choose your weapon and battle the computer!")
 
+col1, col2 = st.columns(2)
+with col1:
+    variant_name = st.selectbox(
+        "Variant:",
+        list(VARIANTS),
+        index=list(VARIANTS).index(st.session_state.variant)
+    )
+    if VARIANTS[variant_name].description:
+        st.caption(VARIANTS[variant_name].description)
+    if variant_name != st.session_state.variant:
+        st.session_state.variant = variant_name
+        st.session_state.predictor = new_predictor(VARIANTS[variant_name])
+        if 'last_result' in st.session_state:
+            del st.session_state.last_result
+            del st.session_state.last_user_choice
+            del st.session_state.last_computer_choice
+with col2:
+    st.session_state.opponent = st.radio(
+        "Opponent:",
+        ["Random", "Adaptive"],
+        index=["Random", "Adaptive"].index(st.session_state.opponent),
+        horizontal=True,
+        help="The adaptive opponent learns your patterns and plays to beat them"
+    )
+
+variant = VARIANTS[st.session_state.variant]
+
 # Display current scores
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -57,61 +106,21 @@ st.divider()
 st.subheader("Make your choice:")
 
 # Create buttons for user choices
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    if st.button("🪨 Rock", use_container_width=True):
-        user_choice = "Rock"
-        computer_choice = get_computer_choice()
-        result = determine_winner(user_choice, computer_choice)
-        
-        # Update game state
-        st.session_state.games_played += 1
-        if result == 'user':
-            st.session_state.user_score += 1
-        elif result == 'computer':
-            st.session_state.computer_score += 1
-        
-        # Store choices for display
-        st.session_state.last_user_choice = user_choice
-        st.session_state.last_computer_choice = computer_choice
-        st.session_state.last_result = result
-
-with col2:
-    if st.button("📄 Paper", use_container_width=True):
-        user_choice = "Paper"
-        computer_choice = get_computer_choice()
-        result = determine_winner(user_choice, computer_choice)
-        
-        # Update game state
-        st.session_state.games_played += 1
-        if result == 'user':
-            st.session_state.user_score += 1
-        elif result == 'computer':
-            st.session_state.computer_score += 1
-        
-        # Store choices for display
-        st.session_state.last_user_choice = user_choice
-        st.session_state.last_computer_choice = computer_choice
-        st.session_state.last_result = result
-
-with col3:
-    if st.button("✂️ Scissors", use_container_width=True):
-        user_choice = "Scissors"
-        computer_choice = get_computer_choice()
-        result = determine_winner(user_choice, computer_choice)
-        
-        # Update game state
-        st.session_state.games_played += 1
-        if result == 'user':
-            st.session_state.user_score += 1
-        elif result == 'computer':
-            st.session_state.computer_score += 1
-        
-        # Store choices for display
-        st.session_state.last_user_choice = user_choice
-        st.session_state.last_computer_choice = computer_choice
-        st.session_state.last_result = result
+if variant.size <= MAX_MOVE_BUTTONS:
+    per_row = 5 if variant.size > 3 else 3
+    for start in range(0, variant.size, per_row):
+        cols = st.columns(per_row)
+        for col, move in zip(cols, variant.moves[start:start + per_row]):
+            with col:
+                if st.button(f"{get_emoji(move, variant)} {move}", key=f"move_{move}", use_container_width=True):
+                    play_round(move, variant)
+else:
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        chosen_move = st.selectbox("Your move:", variant.moves, label_visibility="collapsed")
+    with col2:
+        if st.button("Play", use_container_width=True):
+            play_round(chosen_move, variant)
 
 # Display last game result
 if 'last_result' in st.session_state:
@@ -121,11 +130,11 @@ if 'last_result' in st.session_state:
     col1, col2 = st.columns(2)
     with col1:
         st.write("**You chose:**")
-        st.write(f"{get_emoji(st.session_state.last_user_choice)} {st.session_state.last_user_choice}")
+        st.write(f"{get_emoji(st.session_state.last_user_choice, variant)} {st.session_state.last_user_choice}")
     
     with col2:
         st.write("**Computer chose:**")
-        st.write(f"{get_emoji(st.session_state.last_computer_choice)} {st.session_state.last_computer_choice}")
+        st.write(f"{get_emoji(st.session_state.last_computer_choice, variant)} {st.session_state.last_computer_choice}")
     
     # Display result
     if st.session_state.last_result == 'user':
@@ -141,6 +150,7 @@ if st.button("🔄 Reset Scores", type="secondary"):
     st.session_state.user_score = 0
     st.session_state.computer_score = 0
     st.session_state.games_played = 0
+    st.session_state.predictor = new_predictor(variant)
     # Clear last game results
     if 'last_result' in st.session_state:
         del st.session_state.last_result
@@ -153,9 +163,11 @@ if st.session_state.games_played > 0:
     st.divider()
     st.subheader("📊 Game Statistics")
     
-    user_win_rate = (st.session_state.user_score / st.session_state.games_played) * 100
-    computer_win_rate = (st.session_state.computer_score / st.session_state.games_played) * 100
-    tie_rate = 100 - user_win_rate - computer_win_rate
+    user_win_rate, computer_win_rate, tie_rate = win_rates(
+        st.session_state.user_score,
+        st.session_state.computer_score,
+        st.session_state.games_played
+    )
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -163,4 +175,24 @@ if st.session_state.games_played > 0:
     with col2:
         st.metric("Computer Win Rate", f"{computer_win_rate:.1f}%")
     with col3:
-        st.metric("Tie Rate", f"{tie_rate:.1f}%")
\ No newline at end of file
+        st.metric("Tie Rate", f"{tie_rate:.1f}%")
+
+# Lifetime statistics (kept on disk, so they survive refreshes and restarts)
+lifetime = get_history(variant.name).stats()
+if lifetime['rounds'] > 0:
+    st.divider()
+    st.subheader("📈 Lifetime Statistics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Rounds Played", f"{lifetime['rounds']:,}")
+    with col2:
+        st.metric("Lifetime Win Rate", f"{lifetime['win_rate']:.1f}%")
+    with col3:
+        streak = lifetime['current_streak']
+        st.metric("Current Streak", f"{abs(streak)} {'wins' if streak > 0 else 'losses' if streak < 0 else ''}".strip())
+    with col4:
+        st.metric("Best Win Streak", lifetime['best_win_streak'])
+    
+    st.write("**Your move distribution:**")
+    st.bar_chart(lifetime['move_distribution'])
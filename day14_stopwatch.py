@@ -1,94 +1,213 @@
 import streamlit as st
-import time
-from datetime import datetime, timedelta
+import streamlit.components.v1 as components
 
-def format_time(seconds):
-    """Format seconds into MM:SS.ms format"""
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
-    return f"{minutes:02d}:{remaining_seconds:06.3f}"
+from stopwatch_core import NS_PER_MS, NS_PER_SECOND, Stopwatch, format_time
+from timer_manager import COUNTDOWN, TimerManager
+
+LAP_HISTORY = 1000  # Laps kept for the table and chart; statistics cover every lap
+
+def render_timer(elapsed_ns, is_running):
+    """Render the timer display; while running, the browser ticks it locally
+
+    The server only sends the elapsed time and whether it is running, so
+    nothing reruns between Start/Stop/Lap/Reset clicks.
+    """
+    components.html(f"""
+    <div id="timer" style='text-align: center; font-size: 3rem; font-weight: bold; font-family: sans-serif;
+                background: linear-gradient(90deg, #FF6B6B, #4ECDC4); 
+                -webkit-background-clip: text; -webkit-text-fill-color: transparent;
+                padding: 20px; border-radius: 10px; margin: 20px 0;'>
+        {format_time(elapsed_ns)}
+    </div>
+    <script>
+    const baseMs = {elapsed_ns / NS_PER_MS};
+    const shownAt = performance.now();
+    const timer = document.getElementById("timer");
+    function formatTime(ms) {{
+        const seconds = ms / 1000;
+        const minutes = Math.floor(seconds / 60);
+        return String(minutes).padStart(2, "0") + ":" + (seconds % 60).toFixed(3).padStart(6, "0");
+    }}
+    function tick() {{
+        timer.textContent = formatTime(baseMs + performance.now() - shownAt);
+        requestAnimationFrame(tick);
+    }}
+    if ({'true' if is_running else 'false'}) {{
+        requestAnimationFrame(tick);
+    }}
+    </script>
+    """, height=140)
+
+@st.cache_resource
+def get_timer_manager():
+    """Station timers shared by every session of this deployment"""
+    return TimerManager()
+
+@st.fragment(run_every=1)
+def timer_board(manager):
+    """Live table of all station timers; also fires due alarms"""
+    # poll() reports each alarm once for the whole deployment, so every
+    # session toasts the fired timers (name, generation) it hasn't shown yet.
+    # A newly opened page starts from the alarms that had already gone off.
+    if 'shown_alarms' not in st.session_state:
+        with manager.lock:
+            st.session_state.shown_alarms = {(name, timer.generation)
+                                             for name, timer in manager.timers.items() if timer.has_fired}
+    manager.poll()
+    
+    now = manager.clock()
+    rows = []
+    fired = set()
+    with manager.lock:
+        for name, timer in sorted(manager.timers.items()):
+            if timer.kind == COUNTDOWN:
+                kind, shown = "Countdown", format_time(manager.remaining_ns(name, now))
+            else:
+                kind, shown = "Stopwatch", format_time(manager.elapsed_ns(name, now))
+            if timer.has_fired:
+                fired.add((name, timer.generation))
+            status = "⏰ Done" if timer.has_fired else ("🟢 Running" if timer.is_running else "⏸️ Paused")
+            rows.append({"Timer": name, "Type": kind, "Time": shown, "Status": status})
+    for name, _ in sorted(fired - st.session_state.shown_alarms):
+        st.toast(f"⏰ {name} is done!")
+    st.session_state.shown_alarms = fired
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+    
+    next_alarm = manager.next_alarm()
+    if next_alarm:
+        due, name = next_alarm
+        st.caption(f"Next alarm: **{name}** in {format_time(max(0, due - now))}")
+
+def station_timers_page():
+    st.title("🏋️ Station Timers")
+    st.markdown("---")
+    
+    manager = get_timer_manager()
+    
+    # Add a timer
+    with st.form("add_timer", clear_on_submit=True):
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            name = st.text_input("Name", placeholder="Station 1")
+        with col2:
+            kind = st.selectbox("Type", ["Countdown", "Stopwatch"])
+        with col3:
+            seconds = st.number_input("Seconds", min_value=1, value=60, step=5)
+        
+        if st.form_submit_button("➕ Add Timer"):
+            name = name.strip()
+            if not name:
+                st.error("Please enter a name for the timer.")
+            else:
+                try:
+                    if kind == "Countdown":
+                        manager.add_countdown(name, seconds)
+                    else:
+                        manager.add_stopwatch(name)
+                except ValueError as e:
+                    st.error(str(e))
+    
+    if not manager.timers:
+        st.info("No timers yet. Add one above.")
+        return
+    
+    # Controls for the selected timer
+    col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 1])
+    with col1:
+        selected = st.selectbox("Timer", sorted(manager.timers), label_visibility="collapsed")
+    with col2:
+        if st.button("▶️ Start", key="timer_start", use_container_width=True):
+            manager.start(selected)
+    with col3:
+        if st.button("⏸️ Pause", key="timer_pause", use_container_width=True):
+            manager.pause(selected)
+    with col4:
+        if st.button("🔄 Reset", key="timer_reset", use_container_width=True):
+            manager.reset(selected)
+    with col5:
+        if st.button("🗑️ Remove", key="timer_remove", use_container_width=True):
+            manager.remove(selected)
+            st.rerun()
+    
+    timer_board(manager)
 
 def main():
+    page = st.sidebar.radio("Mode", ["Stopwatch", "Station Timers"])
+    if page == "Station Timers":
+        station_timers_page()
+    else:
+        stopwatch_page()
+
+def render_laps(laps):
+    """Split statistics, a chart of recent splits and one table of laps"""
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Fastest", format_time(laps.fastest[0]), f"Lap {laps.fastest[1]}", delta_color="off")
+    col2.metric("Slowest", format_time(laps.slowest[0]), f"Lap {laps.slowest[1]}", delta_color="off")
+    col3.metric("Mean split", format_time(round(laps.mean_ns)))
+    col4.metric("Std dev", format_time(round(laps.stddev_ns)))
+
+    if len(laps) > 1:
+        st.line_chart({"Split (s)": [split / NS_PER_SECOND for split in laps.recent_splits()]})
+
+    st.dataframe(
+        {
+            "Lap": [number for number, _, _ in laps.newest_first()],
+            "Split": [format_time(split) for _, split, _ in laps.newest_first()],
+            "Total": [format_time(total) for _, _, total in laps.newest_first()],
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    if laps.count > len(laps):
+        st.caption(f"Showing the latest {len(laps)} of {laps.count} laps.")
+
+def stopwatch_page():
     st.title("⏱️ Stopwatch Timer")
     st.markdown("---")
     
     # Initialize session state variables
-    if 'start_time' not in st.session_state:
-        st.session_state.start_time = None
-    if 'elapsed_time' not in st.session_state:
-        st.session_state.elapsed_time = 0.0
-    if 'is_running' not in st.session_state:
-        st.session_state.is_running = False
-    if 'lap_times' not in st.session_state:
-        st.session_state.lap_times = []
-    
-    # Calculate current elapsed time
-    if st.session_state.is_running and st.session_state.start_time:
-        current_elapsed = st.session_state.elapsed_time + (time.time() - st.session_state.start_time)
-    else:
-        current_elapsed = st.session_state.elapsed_time
+    if 'stopwatch' not in st.session_state:
+        st.session_state.stopwatch = Stopwatch(lap_capacity=LAP_HISTORY)
+    stopwatch = st.session_state.stopwatch
     
     # Display the timer
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.markdown(f"""
-        <div style='text-align: center; font-size: 3rem; font-weight: bold; 
-                    background: linear-gradient(90deg, #FF6B6B, #4ECDC4); 
-                    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-                    padding: 20px; border-radius: 10px; margin: 20px 0;'>
-            {format_time(current_elapsed)}
-        </div>
-        """, unsafe_allow_html=True)
+        render_timer(stopwatch.elapsed_ns(), stopwatch.is_running)
     
     # Control buttons
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if st.button("▶️ Start", disabled=st.session_state.is_running, use_container_width=True):
-            st.session_state.is_running = True
-            st.session_state.start_time = time.time()
+        if st.button("▶️ Start", disabled=stopwatch.is_running, use_container_width=True):
+            stopwatch.start()
             st.rerun()
     
     with col2:
-        if st.button("⏸️ Stop", disabled=not st.session_state.is_running, use_container_width=True):
-            if st.session_state.start_time:
-                st.session_state.elapsed_time += time.time() - st.session_state.start_time
-            st.session_state.is_running = False
-            st.session_state.start_time = None
+        if st.button("⏸️ Stop", disabled=not stopwatch.is_running, use_container_width=True):
+            stopwatch.stop()
             st.rerun()
     
     with col3:
         if st.button("🔄 Reset", use_container_width=True):
-            st.session_state.start_time = None
-            st.session_state.elapsed_time = 0.0
-            st.session_state.is_running = False
-            st.session_state.lap_times = []
+            stopwatch.reset()
             st.rerun()
     
     with col4:
-        if st.button("🏁 Lap", disabled=not st.session_state.is_running, use_container_width=True):
-            lap_time = current_elapsed
-            st.session_state.lap_times.append(lap_time)
+        if st.button("🏁 Lap", disabled=not stopwatch.is_running, use_container_width=True):
+            stopwatch.lap()
             st.rerun()
     
-    # Auto-refresh when running
-    if st.session_state.is_running:
-        time.sleep(0.1)
-        st.rerun()
-    
     # Display lap times
-    if st.session_state.lap_times:
+    if stopwatch.laps:
         st.markdown("---")
         st.subheader("🏁 Lap Times")
-        
-        for i, lap_time in enumerate(reversed(st.session_state.lap_times), 1):
-            lap_num = len(st.session_state.lap_times) - i + 1
-            st.markdown(f"**Lap {lap_num}:** {format_time(lap_time)}")
+        render_laps(stopwatch.laps)
     
     # Status indicator
     st.markdown("---")
-    status_color = "🟢" if st.session_state.is_running else "🔴"
-    status_text = "Running" if st.session_state.is_running else "Stopped"
+    status_color = "🟢" if stopwatch.is_running else "🔴"
+    status_text = "Running" if stopwatch.is_running else "Stopped"
     st.markdown(f"**Status:** {status_color} {status_text}")
     
     # Instructions
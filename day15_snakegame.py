@@ -1,84 +1,52 @@
 import streamlit as st
-import random
 import time
 import numpy as np
 
+from snake_engine import SnakeEngine
+from snake_replay import ReplayRecorder, ReplayPlayer, init_replay_db, save_replay, get_top_replays, load_replay, verify_replay
+
 # Initialize session state
 def init_game():
     """Initialize or reset the game state"""
-    st.session_state.board_size = 20
-    st.session_state.snake = [(10, 10), (10, 9), (10, 8)]  # Head at index 0
-    st.session_state.direction = (0, 1)  # Moving right initially
-    st.session_state.food = generate_food()
-    st.session_state.score = 0
-    st.session_state.game_over = False
+    st.session_state.engine = SnakeEngine(board_size=20)
+    st.session_state.recorder = ReplayRecorder(st.session_state.engine)
     st.session_state.game_running = False
-
-def generate_food():
-    """Generate food at a random position not occupied by snake"""
-    while True:
-        food_pos = (
-            random.randint(0, st.session_state.board_size - 1),
-            random.randint(0, st.session_state.board_size - 1)
-        )
-        if food_pos not in st.session_state.snake:
-            return food_pos
+    st.session_state.replay_saved = False
 
 def move_snake():
     """Move the snake in the current direction"""
-    if st.session_state.game_over or not st.session_state.game_running:
+    engine = st.session_state.engine
+    if engine.game_over or not st.session_state.game_running:
         return
     
-    head = st.session_state.snake[0]
-    new_head = (
-        head[0] + st.session_state.direction[0],
-        head[1] + st.session_state.direction[1]
-    )
-    
-    # Check wall collision
-    if (new_head[0] < 0 or new_head[0] >= st.session_state.board_size or
-        new_head[1] < 0 or new_head[1] >= st.session_state.board_size):
-        st.session_state.game_over = True
-        st.session_state.game_running = False
-        return
+    engine.step()
+    st.session_state.recorder.record_tick()
     
-    # Check self collision
-    if new_head in st.session_state.snake:
-        st.session_state.game_over = True
+    if engine.game_over:
         st.session_state.game_running = False
-        return
-    
-    # Move snake
-    st.session_state.snake.insert(0, new_head)
-    
-    # Check food collision
-    if new_head == st.session_state.food:
-        st.session_state.score += 10
-        st.session_state.food = generate_food()
-    else:
-        # Remove tail if no food eaten
-        st.session_state.snake.pop()
+        # Keep every finished game so high scores can be verified and replayed
+        if not st.session_state.replay_saved:
+            save_replay(st.session_state.recorder.to_bytes(), engine.score, engine.ticks)
+            st.session_state.replay_saved = True
 
 def change_direction(new_direction):
     """Change snake direction if valid"""
-    current_dir = st.session_state.direction
-    # Prevent reversing into itself
-    if (new_direction[0] * -1, new_direction[1] * -1) != current_dir:
-        st.session_state.direction = new_direction
+    if st.session_state.engine.change_direction(new_direction):
+        st.session_state.recorder.record_direction(new_direction)
 
-def render_board():
+def render_board(engine):
     """Render the game board using HTML and CSS"""
-    board = np.zeros((st.session_state.board_size, st.session_state.board_size), dtype=int)
+    board = np.zeros((engine.board_size, engine.board_size), dtype=int)
     
     # Place snake (head = 2, body = 1)
-    for i, segment in enumerate(st.session_state.snake):
+    for i, segment in enumerate(engine.snake):
         if i == 0:  # Head
             board[segment[0]][segment[1]] = 2
         else:  # Body
             board[segment[0]][segment[1]] = 1
     
     # Place food (3)
-    board[st.session_state.food[0]][st.session_state.food[1]] = 3
+    board[engine.food[0]][engine.food[1]] = 3
     
     # Generate HTML
     html = """
@@ -133,9 +101,12 @@ st.title("🐍 Snake Game")
 st.write("Use the buttons below to control the snake. Eat the red food to grow and increase your score!")
 
 # Initialize game if not exists
-if 'snake' not in st.session_state:
+if 'engine' not in st.session_state:
+    init_replay_db()
     init_game()
 
+engine = st.session_state.engine
+
 # Game controls
 col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 1])
 
@@ -162,12 +133,12 @@ with col5:
 # Game status and score
 col1, col2, col3 = st.columns(3)
 with col1:
-    st.metric("Score", st.session_state.score)
+    st.metric("Score", engine.score)
 with col2:
-    status = "Game Over" if st.session_state.game_over else ("Running" if st.session_state.game_running else "Paused")
+    status = "Game Over" if engine.game_over else ("Running" if st.session_state.game_running else "Paused")
     st.metric("Status", status)
 with col3:
-    st.metric("Length", len(st.session_state.snake))
+    st.metric("Length", len(engine.snake))
 
 # Restart button
 if st.button("🔄 Restart Game", key="restart"):
@@ -178,19 +149,46 @@ if st.button("🔄 Restart Game", key="restart"):
 board_container = st.empty()
 
 # Game loop
-if st.session_state.game_running and not st.session_state.game_over:
+if st.session_state.game_running and not engine.game_over:
     move_snake()
     time.sleep(0.2)  # Game speed
     st.rerun()
 
 # Display board
-board_container.markdown(render_board(), unsafe_allow_html=True)
+board_container.markdown(render_board(engine), unsafe_allow_html=True)
 
 # Game over message
-if st.session_state.game_over:
-    st.error(f"🎮 Game Over! Your final score was {st.session_state.score}")
+if engine.game_over:
+    st.error(f"🎮 Game Over! Your final score was {engine.score}")
     st.balloons()
 
+# Replays of finished games
+with st.expander("🎬 Replays"):
+    top_replays = get_top_replays()
+    if not top_replays:
+        st.info("Finished games are recorded here automatically.")
+    else:
+        labels = {
+            replay_id: f"#{replay_id} — {score} pts, {ticks} ticks ({size} bytes) — {created_at}"
+            for replay_id, created_at, score, ticks, size in top_replays
+        }
+        replay_id = st.selectbox("Recording", list(labels), format_func=labels.get)
+        scores = {row[0]: row[2] for row in top_replays}
+
+        if st.session_state.get('replay_id') != replay_id:
+            st.session_state.replay_id = replay_id
+            st.session_state.replay_player = ReplayPlayer(load_replay(replay_id))
+        player = st.session_state.replay_player
+
+        tick = st.slider("Tick", 0, player.total_ticks, player.total_ticks, key=f"replay_tick_{replay_id}")
+        st.markdown(render_board(player.seek(tick)), unsafe_allow_html=True)
+
+        if st.button("✅ Verify Score", key="verify_replay"):
+            if verify_replay(load_replay(replay_id), scores[replay_id]):
+                st.success(f"Verified: the recording reproduces {scores[replay_id]} points.")
+            else:
+                st.error("This recording does not reproduce its claimed score.")
+
 # Instructions
 with st.expander("📖 How to Play"):
     st.markdown("""
@@ -1,5 +1,12 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+from pricing import format_cents, to_cents
+from settlement import settle
+from split_engine import Split, to_cents_array
+from trip_ledger import TripLedger
+
 # Set page configuration
 st.set_page_config(
     page_title="Fair Expense Splitter",
@@ -11,72 +18,111 @@ st.set_page_config(
 st.title("💰 Fair Expense Splitter")
 st.write("Easily split expenses among friends after a dinner or trip!")
 
-# Initialize session state for storing people and their contributions
-if 'people' not in st.session_state:
-    st.session_state.people = []
+# Groups larger than this get tables instead of one message per person
+MAX_BALANCE_MESSAGES = 20
+
+def resize_people(people, count):
+    """People table with exactly `count` rows, keeping existing names and amounts"""
+    people = people.head(count)
+    extra = range(len(people), count)
+    return pd.concat([people, pd.DataFrame({
+        "Name": [f"Friend {i + 1}" for i in extra],
+        "Contribution": [0.0] * len(extra),
+        "Weight": [1.0] * len(extra),
+    })], ignore_index=True).astype({"Name": str, "Contribution": float, "Weight": float})
+
+def read_people_csv(file):
+    """Name/Contribution/Weight table from an uploaded CSV (name, contribution and optional weight)"""
+    people = pd.read_csv(file)
+    people.columns = [column.strip().lower() for column in people.columns]
+    if not {"name", "contribution"} <= set(people.columns):
+        raise ValueError("The CSV needs 'name' and 'contribution' columns.")
+    if people.empty:
+        raise ValueError("The CSV has no rows.")
+    contributions = pd.to_numeric(people["contribution"], errors="coerce")
+    if contributions.isna().any() or (contributions < 0).any():
+        raise ValueError("Contributions must be numbers of zero or more.")
+    weights = pd.to_numeric(people["weight"], errors="coerce") if "weight" in people else pd.Series(1.0, index=people.index)
+    if weights.isna().any() or (weights < 0).any():
+        raise ValueError("Weights must be numbers of zero or more.")
+    return pd.DataFrame({"Name": people["name"].astype(str), "Contribution": contributions.astype(float),
+                         "Weight": weights.astype(float)})
 
-# Input section for basic information
-st.header("📊 Basic Information")
-total_amount = st.number_input("Total Amount Spent:", min_value=0.0, value=0.0, step=1.0, format="%.2f")
-num_people = st.number_input("Number of People:", min_value=1, value=2, step=1)
+# Initialize session state for storing people and their contributions
+if 'people' not in st.session_state or "Weight" not in getattr(st.session_state.people, "columns", ()):
+    st.session_state.people = resize_people(pd.DataFrame({"Name": [], "Contribution": [], "Weight": []}), 0)
+    st.session_state.people_edited = st.session_state.people
+if 'ledger' not in st.session_state:
+    st.session_state.ledger = TripLedger()
 
 # Radio button for split type
 split_type = st.radio(
     "How would you like to split the expenses?",
-    ["Equal Split", "Contribution Based Split"],
+    ["Equal Split", "Contribution Based Split", "Trip Ledger"],
     horizontal=True
 )
 
+# Input section for basic information (the trip ledger keeps its own totals and travelers)
+if split_type != "Trip Ledger":
+    st.header("📊 Basic Information")
+    total_amount = st.number_input("Total Amount Spent:", min_value=0.0, value=0.0, step=1.0, format="%.2f")
+    num_people = st.number_input("Number of People:", min_value=1, value=2, step=1)
+
 if split_type == "Contribution Based Split":
     st.header("👥 Individual Contributions")
-    st.write("Enter each person's name and how much they contributed.")
+    st.write("Enter each person's name, how much they contributed and their share weight "
+             "(2 pays twice as much as 1) in the table, or upload a CSV with `name`, "
+             "`contribution` and optional `weight` columns.")
     
-    # Create a compact form for inputs
-    for i in range(num_people):
-        # Use columns to create a compact horizontal layout
-        cols = st.columns([2, 1])
-        with cols[0]:
-            name = st.text_input(f"Person {i+1} Name:", value=f"Friend {i+1}", key=f"name_{i}")
-        with cols[1]:
-            contribution = st.number_input(
-                f"Amount:", 
-                min_value=0.0, 
-                value=0.0, 
-                step=1.0, 
-                format="%.2f",
-                key=f"contribution_{i}"
-            )
-        
-        # Store person data
-        if i < len(st.session_state.people):
-            st.session_state.people[i] = {"name": name, "contribution": contribution}
-        else:
-            st.session_state.people.append({"name": name, "contribution": contribution})
+    uploaded = st.file_uploader("Upload contributions (CSV)", type="csv")
+    if uploaded is not None:
+        try:
+            people = read_people_csv(uploaded)
+        except ValueError as error:
+            st.error(f"⚠️ {error}")
+            st.stop()
+        st.caption(f"Loaded {len(people):,} people from {uploaded.name}; the table sets the group size.")
+    else:
+        # Rebuild the table only when the group size changes, keeping earlier edits
+        if len(st.session_state.people) != num_people:
+            st.session_state.people = resize_people(st.session_state.people_edited, num_people)
+        people = st.session_state.people
     
-    # Ensure we have exactly num_people entries
-    st.session_state.people = st.session_state.people[:num_people]
+    # One editable grid instead of two widgets per person
+    edited = st.data_editor(
+        people,
+        key=f"people_grid_{uploaded.file_id if uploaded is not None else 'manual'}",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Name": st.column_config.TextColumn(required=True),
+            "Contribution": st.column_config.NumberColumn(min_value=0.0, step=1.0, format="$%.2f"),
+            "Weight": st.column_config.NumberColumn(min_value=0.0, step=0.5, format="%.3g"),
+        },
+    )
+    if uploaded is None:
+        st.session_state.people_edited = edited
+    group_size = len(edited)
     
     # Calculate button
     if st.button("Calculate Fair Share", type="primary"):
-        # Calculate fair share per person
-        fair_share = total_amount / num_people
-        
-        # Calculate each person's balance
-        balances = []
-        total_contributed = sum(person["contribution"] for person in st.session_state.people)
-        
-        for person in st.session_state.people:
-            balance = person["contribution"] - fair_share
-            balances.append({
-                "name": person["name"],
-                "contributed": person["contribution"],
-                "fair_share": fair_share,
-                "balance": balance
-            })
+        # Shares and balances for the whole table at once, in cents so they add up exactly
+        fair_share = total_amount / group_size
+        weights = edited["Weight"].fillna(1.0).to_numpy()
+        try:
+            # Contributions and the total are rounded the same way (half up, see pricing.to_cents)
+            split = Split(to_cents_array(edited["Contribution"].fillna(0)), to_cents(total_amount),
+                          None if (weights == 1).all() else weights)
+        except ValueError as error:
+            st.error(f"⚠️ {error}")
+            st.stop()
+        contributions, shares, balance_cents = split.contributions, split.shares, split.balances
+        total_contributed = split.contributed_cents / 100
+        names = edited["Name"].fillna("").tolist()
         
         # Check if total contributions match total amount
-        if abs(total_contributed - total_amount) > 0.01:
-            st.error(f"⚠️ The total contributed (${total_contributed:.2f}) doesn't match the total amount (${total_amount:.2f}). Please adjust the contributions.")
+        if not split.matches_total:
+            st.error(f"⚠️ The total contributed (${total_contributed:,.2f}) doesn't match the total amount (${total_amount:,.2f}). Please adjust the contributions.")
         else:
             # Display results
             st.header("📋 Results")
@@ -85,42 +131,160 @@ if split_type == "Contribution Based Split":
             st.subheader("Summary")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Total Amount", f"${total_amount:.2f}")
+                st.metric("Total Amount", f"${total_amount:,.2f}")
             with col2:
-                st.metric("Number of People", num_people)
+                st.metric("Number of People", f"{group_size:,}")
             with col3:
-                st.metric("Fair Share Each", f"${fair_share:.2f}")
+                st.metric("Average Share", f"${fair_share:,.2f}")
             
-            # Show detailed results
+            # Show detailed results: one message per person for small groups, one table otherwise
             st.subheader("Individual Balances")
-            for balance in balances:
-                if balance["balance"] > 0:
-                    st.success(f"**{balance['name']}** should receive **${balance['balance']:.2f}** (contributed ${balance['contributed']:.2f})")
-                elif balance["balance"] < 0:
-                    st.error(f"**{balance['name']}** should pay **${abs(balance['balance']):.2f}** (contributed ${balance['contributed']:.2f})")
-                else:
-                    st.info(f"**{balance['name']}** is all settled! (contributed exactly ${balance['contributed']:.2f})")
+            if group_size <= MAX_BALANCE_MESSAGES:
+                for name, paid, balance in zip(names, contributions.tolist(), balance_cents.tolist()):
+                    if balance > 0:
+                        st.success(f"**{name}** should receive **{format_cents(balance)}** (contributed {format_cents(paid)})")
+                    elif balance < 0:
+                        st.error(f"**{name}** should pay **{format_cents(-balance)}** (contributed {format_cents(paid)})")
+                    else:
+                        st.info(f"**{name}** is all settled! (contributed exactly {format_cents(paid)})")
+            else:
+                status = np.full(group_size, "settled", dtype=object)
+                status[split.creditors] = "receives"
+                status[split.debtors] = "pays"
+                st.dataframe(
+                    pd.DataFrame({
+                        "Name": names,
+                        "Contributed": contributions / 100,
+                        "Fair Share": shares / 100,
+                        "Balance": balance_cents / 100,
+                        "Status": status,
+                    }),
+                    hide_index=True, use_container_width=True,
+                    column_config={column: st.column_config.NumberColumn(format="$%.2f")
+                                   for column in ("Contributed", "Fair Share", "Balance")}
+                )
             
             # Show transactions needed to settle up
             st.subheader("💡 Suggested Transactions")
-            creditors = [b for b in balances if b["balance"] > 0]
-            debtors = [b for b in balances if b["balance"] < 0]
-            
-            creditors.sort(key=lambda x: x["balance"], reverse=True)
-            debtors.sort(key=lambda x: x["balance"])
-            
-            for debtor in debtors:
-                debt_amount = abs(debtor["balance"])
-                for creditor in creditors:
-                    if creditor["balance"] > 0 and debt_amount > 0:
-                        payment_amount = min(creditor["balance"], debt_amount)
-                        
-                        if payment_amount > 0:
-                            st.write(f"**{debtor['name']}** should pay **${payment_amount:.2f}** to **{creditor['name']}**")
-                            
-                            # Update balances
-                            creditor["balance"] -= payment_amount
-                            debt_amount -= payment_amount
+            transfers = settle(balance_cents.tolist())
+            if len(transfers) <= MAX_BALANCE_MESSAGES:
+                for debtor, creditor, cents in transfers:
+                    st.write(f"**{names[debtor]}** should pay **{format_cents(cents)}** to **{names[creditor]}**")
+            else:
+                st.dataframe(
+                    pd.DataFrame({
+                        "From": [names[debtor] for debtor, _, _ in transfers],
+                        "To": [names[creditor] for _, creditor, _ in transfers],
+                        "Amount": [cents / 100 for _, _, cents in transfers],
+                    }),
+                    hide_index=True, use_container_width=True,
+                    column_config={"Amount": st.column_config.NumberColumn(format="$%.2f")}
+                )
+
+elif split_type == "Trip Ledger":
+    ledger = st.session_state.ledger
+    st.header("🧳 Trip Ledger")
+    st.write("Record every shared expense of the trip; balances update as you go.")
+    
+    # Travelers
+    with st.form("add_traveler", clear_on_submit=True):
+        cols = st.columns([3, 1])
+        with cols[0]:
+            new_person = st.text_input("Traveler name:")
+        with cols[1]:
+            st.write("")
+            if st.form_submit_button("Add Traveler") and new_person.strip():
+                ledger.add_person(new_person.strip())
+    travelers = list(ledger.balances)
+    
+    if len(travelers) < 2:
+        st.info("Add at least two travelers to start recording expenses.")
+    else:
+        # Add or edit an expense
+        expense_ids = list(ledger.expenses)
+        editing = st.selectbox(
+            "Expense:", [None] + expense_ids[::-1],
+            format_func=lambda expense_id: "➕ New expense" if expense_id is None
+            else f"#{expense_id} {ledger.expenses[expense_id].description}"
+        )
+        current = ledger.expenses.get(editing)
+        
+        with st.form("expense"):
+            # Keys include the expense id so the fields refill when another expense is picked
+            description = st.text_input("Description:", value=current.description if current else "",
+                                        key=f"description_{editing}")
+            cols = st.columns(2)
+            with cols[0]:
+                payer = st.selectbox("Paid by:", travelers,
+                                     index=travelers.index(current.payer) if current else 0,
+                                     key=f"payer_{editing}")
+            with cols[1]:
+                amount = st.number_input("Amount:", min_value=0.0, step=1.0, format="%.2f",
+                                         value=current.amount_cents / 100 if current else 0.0,
+                                         key=f"amount_{editing}")
+            participants = st.multiselect("Split between:", travelers,
+                                          default=list(current.weights) if current else travelers,
+                                          key=f"participants_{editing}")
+            weights_text = st.text_input(
+                "Weights (optional, e.g. Ana=2, Ben=1):",
+                value=", ".join(f"{name}={weight}" for name, weight in current.weights.items()
+                                if weight != 1) if current else "",
+                key=f"weights_{editing}"
+            )
+            save_col, delete_col = st.columns(2)
+            with save_col:
+                saved = st.form_submit_button("💾 Save Expense", type="primary")
+            with delete_col:
+                deleted = st.form_submit_button("🗑️ Delete Expense", disabled=current is None)
+        
+        if saved:
+            try:
+                weights = {}
+                for part in filter(None, (part.strip() for part in weights_text.split(","))):
+                    if "=" not in part:
+                        raise ValueError(f"Weight '{part}' should look like Name=2")
+                    name, weight = part.rsplit("=", 1)
+                    weights[name.strip()] = float(weight)
+                if editing is None:
+                    ledger.add_expense(payer, to_cents(amount), participants, weights, description)
+                else:
+                    ledger.edit_expense(editing, payer, to_cents(amount), participants, weights, description)
+                st.rerun()
+            except ValueError as error:
+                st.error(f"⚠️ {error}")
+        if deleted:
+            ledger.delete_expense(editing)
+            st.rerun()
+        
+        # Balances and settlement
+        st.header("📋 Results")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Trip Total", format_cents(ledger.total_cents()))
+        with col2:
+            st.metric("Expenses", len(ledger.expenses))
+        with col3:
+            st.metric("Travelers", len(travelers))
+        
+        st.subheader("Individual Balances")
+        st.dataframe(
+            [{"Traveler": name, "Balance": format_cents(cents),
+              "Status": "receives" if cents > 0 else "pays" if cents < 0 else "settled"}
+             for name, cents in ledger.balances.items()],
+            hide_index=True, use_container_width=True
+        )
+        
+        st.subheader("💡 Suggested Transactions")
+        for debtor, creditor, cents in ledger.settlement():
+            st.write(f"**{debtor}** should pay **{format_cents(cents)}** to **{creditor}**")
+        
+        with st.expander("🧾 All Expenses"):
+            st.dataframe(
+                [{"#": expense_id, "Description": expense.description, "Paid by": expense.payer,
+                  "Amount": format_cents(expense.amount_cents), "Split between": ", ".join(expense.weights)}
+                 for expense_id, expense in ledger.expenses.items()],
+                hide_index=True, use_container_width=True
+            )
 
 else:
     # Equal split mode
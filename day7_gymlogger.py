@@ -6,7 +6,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from profiler import render_timing_panel, timed
+
 # Initialize the database
+@timed("db.init_database")
 def init_database():
     conn = sqlite3.connect('workout_logger.db')
     c = conn.cursor()
@@ -29,6 +32,7 @@ def init_database():
     conn.close()
 
 # Add workout to database
+@timed("db.add_workout")
 def add_workout(date, exercise, sets, reps, weight, notes=""):
     conn = sqlite3.connect('workout_logger.db')
     c = conn.cursor()
@@ -42,6 +46,7 @@ def add_workout(date, exercise, sets, reps, weight, notes=""):
     conn.close()
 
 # Get all workouts from database
+@timed("db.get_all_workouts")
 def get_all_workouts():
     conn = sqlite3.connect('workout_logger.db')
     df = pd.read_sql_query("SELECT * FROM workouts ORDER BY date DESC, id DESC", conn)
@@ -49,6 +54,7 @@ def get_all_workouts():
     return df
 
 # Get workouts for a specific exercise
+@timed("db.get_exercise_history")
 def get_exercise_history(exercise):
     conn = sqlite3.connect('workout_logger.db')
     df = pd.read_sql_query(
@@ -59,6 +65,7 @@ def get_exercise_history(exercise):
     return df
 
 # Delete workout
+@timed("db.delete_workout")
 def delete_workout(workout_id):
     conn = sqlite3.connect('workout_logger.db')
     c = conn.cursor()
@@ -67,6 +74,7 @@ def delete_workout(workout_id):
     conn.close()
 
 # Get unique exercises
+@timed("db.get_exercises")
 def get_exercises():
     conn = sqlite3.connect('workout_logger.db')
     c = conn.cursor()
@@ -76,6 +84,7 @@ def get_exercises():
     return exercises
 
 # Calculate weekly progress
+@timed("db.get_weekly_progress")
 def get_weekly_progress():
     conn = sqlite3.connect('workout_logger.db')
     df = pd.read_sql_query('''
@@ -121,6 +130,9 @@ def main():
         workout_history_page()
     elif page == "Progress Analytics":
         progress_analytics_page()
+    
+    with st.sidebar:
+        render_timing_panel(title="⏱️ Database Timings")
 
 def log_workout_page():
     st.header("📝 Log New Workout")
@@ -0,0 +1,276 @@
+import random
+import time
+
+# Generalised N×N, k-in-a-row engine (tic-tac-toe is N=3, k=3; gomoku is N=15, k=5).
+# Win checks only look at the lines through the last move, so they cost O(k)
+# instead of a rescan of the whole board.
+
+EMPTY, X, O = 0, 1, 2
+MARKS = {EMPTY: '', X: 'X', O: 'O'}
+PLAYERS = {'X': X, 'O': O}
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+# Default thinking time for the computer, in seconds
+MOVE_TIME_BUDGET = 1.0
+
+BOARD_VARIANTS = {
+    'Classic 3×3': (3, 3),
+    '5×5 (4 in a row)': (5, 4),
+    '7×7 (5 in a row)': (7, 5),
+    '15×15 Gomoku': (15, 5),
+}
+
+
+class GridBoard:
+    """N×N board where k marks in a row win"""
+
+    def __init__(self, size=15, k=5):
+        self.size = size
+        self.k = k
+        self.cells = bytearray(size * size)
+        self.stones = []  # Occupied indices in move order
+        self.moves = 0
+        self.win_player = EMPTY
+        self.win_line = []
+
+    @property
+    def current_player(self):
+        # X always starts
+        return 'X' if self.moves % 2 == 0 else 'O'
+
+    def is_empty(self, row, col):
+        return self.cells[row * self.size + col] == EMPTY
+
+    def _run(self, row, col, dr, dc, player):
+        """Cells of player's contiguous run from (row, col), walking one way"""
+        run = []
+        r, c = row + dr, col + dc
+        while 0 <= r < self.size and 0 <= c < self.size and self.cells[r * self.size + c] == player and len(run) < self.k:
+            run.append((r, c))
+            r, c = r + dr, c + dc
+        return run
+
+    def winning_line_through(self, row, col):
+        """Return the k-in-a-row through (row, col), or [] — O(k) per direction"""
+        player = self.cells[row * self.size + col]
+        if player == EMPTY:
+            return []
+        for dr, dc in DIRECTIONS:
+            back = self._run(row, col, -dr, -dc, player)
+            forward = self._run(row, col, dr, dc, player)
+            if len(back) + 1 + len(forward) >= self.k:
+                return list(reversed(back)) + [(row, col)] + forward
+        return []
+
+    def play(self, row, col, player=None):
+        """Place a mark and update the win state from this move only"""
+        mark = PLAYERS[player or self.current_player]
+        index = row * self.size + col
+        self.cells[index] = mark
+        self.stones.append(index)
+        self.moves += 1
+
+        line = self.winning_line_through(row, col)
+        if line:
+            self.win_player, self.win_line = mark, line
+
+    def undo(self):
+        """Take back the last move (used by the search)"""
+        index = self.stones.pop()
+        self.cells[index] = EMPTY
+        self.moves -= 1
+        self.win_player, self.win_line = EMPTY, []
+
+    def winner(self):
+        """Return the winner and winning line coordinates"""
+        if self.win_player:
+            return MARKS[self.win_player], self.win_line
+        return None, []
+
+    def is_full(self):
+        return self.moves == self.size * self.size
+
+    def empty_cells(self):
+        return [divmod(i, self.size) for i, cell in enumerate(self.cells) if cell == EMPTY]
+
+    def to_rows(self):
+        """The list-of-lists view used by the UI"""
+        return [
+            [MARKS[self.cells[r * self.size + c]] for c in range(self.size)]
+            for r in range(self.size)
+        ]
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class GomokuAI:
+    """Iterative-deepening alpha-beta with a per-move time budget
+
+    Only empty cells next to existing stones are searched, ordered by a
+    local threat score, and the best move of the deepest completed
+    iteration is played when the budget runs out.
+    """
+
+    WIN_SCORE = 10 ** 9
+
+    def __init__(self, time_budget=MOVE_TIME_BUDGET, max_candidates=12):
+        self.time_budget = time_budget
+        self.max_candidates = max_candidates
+        self.deadline = 0.0
+        self.nodes = 0
+        self.depth_reached = 0
+
+    def _local_score(self, board, index, mark):
+        """How strong a line mark would make by playing at index"""
+        size = board.size
+        row, col = divmod(index, size)
+        score = 0
+        for dr, dc in DIRECTIONS:
+            count = 1
+            open_ends = 0
+            for sign in (1, -1):
+                r, c = row + dr * sign, col + dc * sign
+                steps = 0
+                while 0 <= r < size and 0 <= c < size and board.cells[r * size + c] == mark and steps < board.k:
+                    count += 1
+                    steps += 1
+                    r, c = r + dr * sign, c + dc * sign
+                if 0 <= r < size and 0 <= c < size and board.cells[r * size + c] == EMPTY:
+                    open_ends += 1
+            if count >= board.k:
+                score += self.WIN_SCORE
+            elif open_ends:
+                score += 10 ** count * open_ends
+        return score
+
+    def candidates(self, board, mark):
+        """Empty cells adjacent to stones, best attacking/blocking cells first"""
+        size = board.size
+        if not board.stones:
+            centre = (size // 2) * size + size // 2
+            return [centre]
+
+        seen = set()
+        for index in board.stones:
+            row, col = divmod(index, size)
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    r, c = row + dr, col + dc
+                    if 0 <= r < size and 0 <= c < size and board.cells[r * size + c] == EMPTY:
+                        seen.add(r * size + c)
+
+        opponent = O if mark == X else X
+        scored = sorted(
+            seen,
+            key=lambda i: self._local_score(board, i, mark) + self._local_score(board, i, opponent),
+            reverse=True
+        )
+        return scored[:self.max_candidates]
+
+    def evaluate(self, board, mark, moves):
+        """Static score for the side to move: best own threat minus best opposing threat"""
+        opponent = O if mark == X else X
+        own = [self._local_score(board, i, mark) for i in moves]
+        theirs = [self._local_score(board, i, opponent) for i in moves]
+
+        # Completed lines are decided here, but kept below a real win
+        if max(own) >= self.WIN_SCORE:
+            return self.WIN_SCORE // 2
+        if sum(score >= self.WIN_SCORE for score in theirs) >= 2:
+            return -self.WIN_SCORE // 2
+        return max(own) - max((score for score in theirs if score < self.WIN_SCORE), default=0)
+
+    def negamax(self, board, depth, alpha, beta):
+        self.nodes += 1
+        if self.nodes & 15 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+
+        if board.win_player:
+            # The previous move won; prefer quicker wins
+            return -self.WIN_SCORE - depth
+        if board.is_full():
+            return 0
+
+        mark = PLAYERS[board.current_player]
+        moves = self.candidates(board, mark)
+        if depth == 0:
+            return self.evaluate(board, mark, moves)
+
+        best = -self.WIN_SCORE * 2
+        for index in moves:
+            board.play(*divmod(index, board.size))
+            try:
+                value = -self.negamax(board, depth - 1, -beta, -alpha)
+            finally:
+                board.undo()
+            if value > best:
+                best = value
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+        return best
+
+    def search(self, board):
+        """Return the best (row, col) found within the time budget"""
+        self.deadline = time.perf_counter() + self.time_budget
+        self.nodes = 0
+        self.depth_reached = 0
+
+        mark = PLAYERS[board.current_player]
+        moves = self.candidates(board, mark)
+        if not moves:
+            return None
+        best_move = moves[0]
+        if len(moves) == 1:
+            return divmod(best_move, board.size)
+
+        # Take an immediate win without searching
+        for index in moves:
+            if self._local_score(board, index, mark) >= self.WIN_SCORE:
+                return divmod(index, board.size)
+
+        depth = 1
+        max_depth = board.size * board.size - board.moves
+        while depth <= max_depth:
+            try:
+                alpha, best_at_depth = -self.WIN_SCORE * 2, moves[0]
+                for index in moves:
+                    board.play(*divmod(index, board.size))
+                    try:
+                        value = -self.negamax(board, depth - 1, -self.WIN_SCORE * 2, -alpha)
+                    finally:
+                        board.undo()
+                    if value > alpha:
+                        alpha, best_at_depth = value, index
+            except SearchTimeout:
+                break
+
+            best_move = best_at_depth
+            self.depth_reached = depth
+            # Searching deeper cannot change a forced result
+            if abs(alpha) >= self.WIN_SCORE:
+                break
+            # Put the current best first so the next iteration cuts off sooner
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+            depth += 1
+
+        return divmod(best_move, board.size)
+
+
+def seed_worker():
+    """Process pool initializer: give each search worker its own random sequence"""
+    random.seed()
+
+
+def choose_grid_move(board, optimal_probability=1.0, time_budget=MOVE_TIME_BUDGET):
+    """Pick a move, mixing searched and random play like the 3×3 difficulty levels"""
+    if random.random() < optimal_probability:
+        move = GomokuAI(time_budget).search(board)
+        if move is not None:
+            return move
+    empty_cells = board.empty_cells()
+    return random.choice(empty_cells) if empty_cells else None
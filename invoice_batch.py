@@ -0,0 +1,77 @@
+import argparse
+import os
+import random
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+from invoice_render import invoice_filename, render_pdf
+from order_store import ORDER_DB, Order, load_orders
+from restaurant_menu import MENU_ITEMS, TAX_RATE
+
+# End-of-day invoice run for accounting: renders a PDF for every order placed
+# on one day across a process pool and writes them into a single zip archive.
+# Each worker imports invoice_render once, so the stylesheet and table style
+# are built once per process rather than once per invoice.
+
+
+def render_chunk(orders):
+    """Worker entry point: [(file name, PDF bytes), ...] for a chunk of orders"""
+    return [(invoice_filename(order), render_pdf(order)) for order in orders]
+
+
+def synthetic_orders(count, day, seed=0):
+    """Random orders for benchmarking without a populated database"""
+    rng = random.Random(seed)
+    start = datetime.combine(day, datetime.min.time()) + timedelta(hours=11)
+    return [
+        Order(
+            [(item, price, rng.randint(1, 3)) for item, price in rng.sample(MENU_ITEMS, rng.randint(1, 6))],
+            TAX_RATE,
+            (start + timedelta(seconds=n * 12 * 3600 // count)).isoformat(timespec='seconds'),
+            n + 1,
+        )
+        for n in range(count)
+    ]
+
+
+def run_batch(orders, archive_path, workers=None, chunk_size=50):
+    """Render every order into archive_path; return invoices per second"""
+    chunks = [orders[i:i + chunk_size] for i in range(0, len(orders), chunk_size)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for rendered in pool.map(render_chunk, chunks):
+            for filename, pdf in rendered:
+                archive.writestr(filename, pdf)
+    elapsed = time.perf_counter() - start
+    return len(orders) / elapsed if elapsed else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a day's invoices into one archive")
+    parser.add_argument('--date', type=date.fromisoformat, default=date.today(), help="YYYY-MM-DD")
+    parser.add_argument('--db', default=ORDER_DB)
+    parser.add_argument('--output', help="archive path (default invoices_<date>.zip)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-size', type=int, default=50)
+    parser.add_argument('--synthetic', type=int, metavar='N', help="render N random orders instead of the database")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        orders = synthetic_orders(args.synthetic, args.date)
+    else:
+        orders = load_orders(args.date.isoformat(), (args.date + timedelta(days=1)).isoformat(), args.db)
+    if not orders:
+        print(f"No orders on {args.date}")
+        return
+
+    output = args.output or f"invoices_{args.date}.zip"
+    invoices_per_second = run_batch(orders, output, args.workers, args.chunk_size)
+    print(f"{len(orders):,} invoices -> {output} ({os.path.getsize(output) / 1e6:.1f} MB)")
+    print(f"{invoices_per_second:,.0f} invoices/second with {args.workers} workers")
+
+
+if __name__ == "__main__":
+    main()
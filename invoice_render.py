@@ -0,0 +1,83 @@
+import io
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from profiler import timed
+
+# PDF invoices for restaurant orders, kept free of Streamlit so the app and
+# the end-of-day batch job (invoice_batch.py) share one renderer. The style
+# objects are built once per process and reused for every invoice.
+
+STYLES = getSampleStyleSheet()
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=1  # Center alignment
+)
+TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, -1), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+COLUMN_WIDTHS = [3*inch, 1*inch, 0.5*inch, 1*inch]
+
+
+def invoice_filename(order, extension='pdf'):
+    if order.order_id is not None:
+        return f"invoice_{order.order_id:06d}.{extension}"
+    return f"invoice_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+
+def render_pdf(order):
+    """Render an order (order_store.Order) as PDF bytes"""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    story = []
+
+    # Header
+    title = "🍔 Restaurant Invoice"
+    if order.order_id is not None:
+        title += f" #{order.order_id}"
+    created_at = order.created_at or datetime.now().isoformat(timespec='seconds')
+    story.append(Paragraph(title, TITLE_STYLE))
+    story.append(Paragraph(f"Date: {created_at.replace('T', ' ')}", STYLES['Normal']))
+    story.append(Spacer(1, 20))
+
+    # Order details
+    subtotal, tax, total = order.totals()
+    table_data = [['Item', 'Price', 'Qty', 'Subtotal']]
+    for (item, price, quantity), line_cents in zip(order.lines, order.line_totals_cents()):
+        table_data.append([
+            item,
+            f"${price:.2f}",
+            str(quantity),
+            f"${line_cents / 100:.2f}"
+        ])
+
+    # Summary rows
+    table_data.append(['', '', '', ''])
+    table_data.append(['Subtotal', '', '', f"${subtotal:.2f}"])
+    table_data.append([f'Tax ({order.tax_rate*100}%)', '', '', f"${tax:.2f}"])
+    table_data.append(['TOTAL', '', '', f"${total:.2f}"])
+
+    table = Table(table_data, colWidths=COLUMN_WIDTHS)
+    table.setStyle(TABLE_STYLE)
+    story.append(table)
+
+    with timed("build"):
+        doc.build(story)
+    return buffer.getvalue()
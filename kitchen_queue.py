@@ -0,0 +1,244 @@
+import argparse
+import asyncio
+import itertools
+import random
+import threading
+
+from profiler import LabelStats
+from restaurant_menu import ITEM_CATEGORY, MENU_ITEMS
+from stopwatch_core import NS_PER_MINUTE, NS_PER_SECOND
+
+# Kitchen ticket queue for the restaurant app (day11_resorder_bill.py).
+# A submitted order is split into one ticket per line and routed to a station
+# by its menu category. Each station is an asyncio.PriorityQueue worked by a
+# fixed number of slots (burners, oven space, bartenders), so rush orders
+# jump the line without stopping other work already on the station.
+# Times are in kitchen seconds: with time_scale=60 a minute of kitchen time
+# passes in one real second (the simulator uses this to replay a whole
+# evening quickly; the app runs at time_scale=1).
+
+RUSH, NORMAL = 0, 1  # Lower sorts first
+PRIORITY_NAMES = {RUSH: 'rush', NORMAL: 'normal'}
+
+# Station -> (parallel slots, mean prep seconds for one item)
+STATIONS = {
+    'grill': (10, 420),
+    'pizza': (12, 540),
+    'pasta': (10, 420),
+    'cold': (8, 180),
+    'bar': (3, 45),
+}
+
+STATION_FOR_CATEGORY = {
+    "🍔 Burgers": 'grill',
+    "🍕 Pizza": 'pizza',
+    "🍝 Pasta": 'pasta',
+    "🥗 Salads": 'cold',
+    "🥤 Beverages": 'bar',
+    "🍰 Desserts": 'cold',
+}
+DEFAULT_STATION = 'grill'
+
+# Orders per hour on a typical Friday, from opening to close
+FRIDAY_NIGHT = [(17, 60), (18, 110), (19, 150), (20, 140), (21, 90), (22, 50)]
+
+
+def station_for(item):
+    return STATION_FOR_CATEGORY.get(ITEM_CATEGORY.get(item), DEFAULT_STATION)
+
+
+class StationMetrics:
+    """Throughput and latency for one station (latencies in ns of kitchen time)"""
+
+    def __init__(self):
+        self.completed = 0
+        self.busy_seconds = 0.0
+        self.wait = LabelStats()      # Queued until a slot picks the ticket up
+        self.latency = LabelStats()   # Queued until the ticket is done
+
+
+class Kitchen:
+    """Priority ticket queues per station, worked by one asyncio task per slot"""
+
+    def __init__(self, stations=STATIONS, time_scale=1.0, seed=None):
+        self.stations = stations
+        self.time_scale = time_scale
+        self.rng = random.Random(seed)
+        self.sequence = itertools.count()  # FIFO within a priority
+        self.queues = {}
+        self.metrics = {station: StationMetrics() for station in stations}
+        self.order_latency = {priority: LabelStats() for priority in PRIORITY_NAMES}
+        self.open_tickets = {}  # order id -> [tickets left, submitted at, priority]
+        self.workers = []
+        self.loop = None
+        self.started_at = 0.0
+
+    def now(self):
+        """Kitchen time in seconds"""
+        return self.loop.time() * self.time_scale
+
+    async def sleep_until(self, kitchen_time):
+        """Sleep until an absolute kitchen time, so oversleeping doesn't accumulate"""
+        await asyncio.sleep(max(0.0, kitchen_time - self.now()) / self.time_scale)
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.started_at = self.now()
+        for station, (slots, _) in self.stations.items():
+            self.queues[station] = asyncio.PriorityQueue()
+            for _ in range(slots):
+                self.workers.append(asyncio.create_task(self._cook(station)))
+
+    def submit(self, order_id, lines, priority=NORMAL):
+        """Queue one ticket per (item, price, quantity) line; call on the loop thread"""
+        submitted_at = self.now()
+        self.open_tickets[order_id] = [len(lines), submitted_at, priority]
+        for item, _, quantity in lines:
+            station = station_for(item)
+            ticket = (priority, next(self.sequence), order_id, item, quantity, submitted_at)
+            self.queues[station].put_nowait(ticket)
+
+    def submit_threadsafe(self, order_id, lines, priority=NORMAL):
+        """submit() from another thread, e.g. a Streamlit script run"""
+        self.loop.call_soon_threadsafe(self.submit, order_id, lines, priority)
+
+    def prep_seconds(self, station, quantity):
+        """Kitchen time for one ticket: extra portions cost half an item each"""
+        mean = self.stations[station][1]
+        return mean * (1 + 0.5 * (quantity - 1)) * self.rng.uniform(0.75, 1.25)
+
+    async def _cook(self, station):
+        queue = self.queues[station]
+        metrics = self.metrics[station]
+        while True:
+            priority, _, order_id, item, quantity, submitted_at = await queue.get()
+            picked_up = self.now()
+            prep = self.prep_seconds(station, quantity)
+            await asyncio.sleep(prep / self.time_scale)
+            done = self.now()
+
+            metrics.completed += 1
+            metrics.busy_seconds += done - picked_up
+            metrics.wait.add(round((picked_up - submitted_at) * NS_PER_SECOND))
+            metrics.latency.add(round((done - submitted_at) * NS_PER_SECOND))
+
+            remaining = self.open_tickets[order_id]
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                self.order_latency[remaining[2]].add(round((done - remaining[1]) * NS_PER_SECOND))
+                del self.open_tickets[order_id]
+            queue.task_done()
+
+    async def drain(self):
+        """Wait until every queued ticket has been cooked"""
+        for queue in self.queues.values():
+            await queue.join()
+
+    def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+
+    def summary(self):
+        """One row per station; times in minutes of kitchen time"""
+        hours = max(self.now() - self.started_at, 1e-9) / 3600
+        rows = []
+        for station, metrics in self.metrics.items():
+            slots = self.stations[station][0]
+            done = metrics.completed
+            rows.append({
+                'station': station,
+                'queued': self.queues[station].qsize() if station in self.queues else 0,
+                'completed': done,
+                'tickets/hour': done / hours,
+                'utilisation %': 100 * metrics.busy_seconds / (hours * 3600 * slots),
+                'wait p50 min': metrics.wait.percentile(0.50) / NS_PER_MINUTE if done else 0.0,
+                'wait p95 min': metrics.wait.percentile(0.95) / NS_PER_MINUTE if done else 0.0,
+                'ticket p95 min': metrics.latency.percentile(0.95) / NS_PER_MINUTE if done else 0.0,
+            })
+        return rows
+
+    def summary_threadsafe(self):
+        """summary() from another thread; runs on the loop so the counters are consistent"""
+        async def snapshot():
+            return self.summary()
+        return asyncio.run_coroutine_threadsafe(snapshot(), self.loop).result()
+
+
+def start_background_kitchen(**kwargs):
+    """Run a Kitchen on its own event loop thread and return it once started"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name='kitchen', daemon=True).start()
+    kitchen = Kitchen(**kwargs)
+    asyncio.run_coroutine_threadsafe(kitchen.start(), loop).result()
+    return kitchen
+
+
+def random_order(rng):
+    """A party's order: a few mains plus drinks, as (item, price, quantity) lines"""
+    picks = rng.sample(MENU_ITEMS, rng.randint(1, 5))
+    return [(item, price, rng.choice((1, 1, 1, 2, 3))) for item, price in picks]
+
+
+async def simulate(profile=FRIDAY_NIGHT, time_scale=1800.0, rush_fraction=0.1, seed=0):
+    """Replay Poisson arrivals at each hour's rate; return the drained Kitchen
+
+    Arrivals are scheduled on an absolute timeline from the start, so how
+    long each sleep overshoots doesn't change how many orders arrive.
+    """
+    rng = random.Random(seed)
+    kitchen = Kitchen(time_scale=time_scale, seed=seed)
+    await kitchen.start()
+
+    order_id = 0
+    next_arrival = kitchen.started_at
+    for _, orders_per_hour in profile:
+        hour_ends = next_arrival + 3600
+        while True:
+            next_arrival += rng.expovariate(orders_per_hour / 3600)
+            if next_arrival >= hour_ends:
+                next_arrival = hour_ends  # Arrivals are memoryless, so the next hour starts afresh
+                await kitchen.sleep_until(hour_ends)
+                break
+            await kitchen.sleep_until(next_arrival)
+            order_id += 1
+            priority = RUSH if rng.random() < rush_fraction else NORMAL
+            kitchen.submit(order_id, random_order(rng), priority)
+
+    await kitchen.drain()
+    kitchen.stop()
+    return kitchen
+
+
+def print_report(kitchen):
+    rows = kitchen.summary()
+    print(f"{'station':>8} {'tickets':>8} {'per hour':>9} {'util %':>7} "
+          f"{'wait p50':>9} {'wait p95':>9} {'ticket p95':>11}   (minutes)")
+    for row in rows:
+        print(f"{row['station']:>8} {row['completed']:>8} {row['tickets/hour']:>9.1f} "
+              f"{row['utilisation %']:>7.1f} {row['wait p50 min']:>9.1f} "
+              f"{row['wait p95 min']:>9.1f} {row['ticket p95 min']:>11.1f}")
+    print()
+    for priority, orders in kitchen.order_latency.items():
+        if orders.count:
+            print(f"{orders.count:5d} {PRIORITY_NAMES[priority]:>6} orders: complete in "
+                  f"p50 {orders.percentile(0.50) / NS_PER_MINUTE:5.1f} min, "
+                  f"p95 {orders.percentile(0.95) / NS_PER_MINUTE:5.1f} min")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a Friday night in the kitchen")
+    parser.add_argument('--speed', type=float, default=1800.0, help="kitchen seconds per real second")
+    parser.add_argument('--rate-multiplier', type=float, default=1.0, help="scale the Friday order rate")
+    parser.add_argument('--rush-fraction', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    profile = [(hour, rate * args.rate_multiplier) for hour, rate in FRIDAY_NIGHT]
+    print(f"Friday night {profile[0][0]}:00-{profile[-1][0] + 1}:00, "
+          f"{sum(rate for _, rate in profile):.0f} orders expected, {args.speed:.0f}× speed\n")
+    kitchen = asyncio.run(simulate(profile, args.speed, args.rush_fraction, args.seed))
+    print_report(kitchen)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+import sqlite3
+import time
+from datetime import datetime
+
+import numpy as np
+
+from pricing import apply_rate, price_bill, reprice, to_basis_points, to_cents
+
+# Order storage for the restaurant app (day11_resorder_bill.py).
+#   orders / order_items: one row per checkout and per cart line
+#   sales_by_hour / item_sales: rollups updated in the same transaction as
+#   each order, so dashboard queries read a few hundred rows however many
+#   orders have been stored
+# Money is stored as integer cents (see pricing.py) so the sums never drift.
+
+ORDER_DB = 'restaurant_orders.db'
+
+
+class Order:
+    """An order to invoice: lines are (item, price, quantity)
+
+    Orders loaded from the database keep the (subtotal, tax, total) cents they
+    were charged, and invoices show those rather than recomputing them.
+    """
+
+    def __init__(self, lines, tax_rate, created_at=None, order_id=None, stored_cents=None):
+        self.lines = tuple(lines)
+        self.tax_rate = tax_rate
+        self.created_at = created_at
+        self.order_id = order_id
+        self.stored_cents = stored_cents
+
+    def _price(self):
+        return price_bill(
+            [to_cents(price) for _, price, _ in self.lines],
+            [quantity for _, _, quantity in self.lines],
+            to_basis_points(self.tax_rate),
+        )
+
+    def line_totals_cents(self):
+        """Exact price × quantity of each line in cents"""
+        return self._price()[0].tolist()
+
+    def totals_cents(self):
+        """Exact subtotal, tax, and total in cents"""
+        if self.stored_cents is not None:
+            return self.stored_cents
+        _, subtotal, _, tax, total = self._price()
+        return subtotal, tax, total
+
+    def totals(self):
+        """Subtotal, tax, and total in dollars"""
+        return tuple(cents / 100 for cents in self.totals_cents())
+
+
+def init_order_db(db_path=ORDER_DB):
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            subtotal_cents INTEGER NOT NULL,
+            tax_cents INTEGER NOT NULL,
+            total_cents INTEGER NOT NULL,
+            item_count INTEGER NOT NULL,
+            tax_rate REAL NOT NULL DEFAULT 0
+        )
+    ''')
+    # Databases created before tax_rate was stored: recover each order's rate
+    # (to the basis point) from the tax it was charged
+    if 'tax_rate' not in [row[1] for row in c.execute("PRAGMA table_info(orders)")]:
+        c.execute("ALTER TABLE orders ADD COLUMN tax_rate REAL NOT NULL DEFAULT 0")
+        c.execute(
+            "UPDATE orders SET tax_rate = ROUND(tax_cents * 1.0 / subtotal_cents, 4) WHERE subtotal_cents > 0"
+        )
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS order_items (
+            order_id INTEGER NOT NULL REFERENCES orders (id),
+            item TEXT NOT NULL,
+            category TEXT,
+            price_cents INTEGER NOT NULL,
+            quantity INTEGER NOT NULL
+        )
+    ''')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS sales_by_hour (
+            hour TEXT PRIMARY KEY,
+            orders INTEGER NOT NULL,
+            items INTEGER NOT NULL,
+            revenue_cents INTEGER NOT NULL
+        )
+    ''')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS item_sales (
+            item TEXT PRIMARY KEY,
+            category TEXT,
+            quantity INTEGER NOT NULL,
+            revenue_cents INTEGER NOT NULL
+        )
+    ''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders (created_at)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_order_items_order ON order_items (order_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_order_items_item ON order_items (item)")
+
+    conn.commit()
+    conn.close()
+
+
+def _add_to_rollups(c, hour, item_count, subtotal_cents, lines):
+    """Fold one order into sales_by_hour and item_sales"""
+    c.execute('''
+        INSERT INTO sales_by_hour (hour, orders, items, revenue_cents) VALUES (?, 1, ?, ?)
+        ON CONFLICT (hour) DO UPDATE SET
+            orders = orders + 1,
+            items = items + excluded.items,
+            revenue_cents = revenue_cents + excluded.revenue_cents
+    ''', (hour, item_count, subtotal_cents))
+    c.executemany('''
+        INSERT INTO item_sales (item, category, quantity, revenue_cents) VALUES (?, ?, ?, ?)
+        ON CONFLICT (item) DO UPDATE SET
+            quantity = quantity + excluded.quantity,
+            revenue_cents = revenue_cents + excluded.revenue_cents
+    ''', [(item, category, quantity, price_cents * quantity)
+          for item, category, price_cents, quantity in lines])
+
+
+def save_order(lines, tax_rate, categories=None, created_at=None, db_path=ORDER_DB):
+    """Store a checkout; lines are (item, price, quantity). Returns the order id.
+
+    Revenue in the rollups is the pre-tax subtotal.
+    """
+    categories = categories or {}
+    created_at = created_at or datetime.now().isoformat(timespec='seconds')
+    cent_lines = [(item, categories.get(item), to_cents(price), quantity)
+                  for item, price, quantity in lines]
+    subtotal_cents = sum(price_cents * quantity for _, _, price_cents, quantity in cent_lines)
+    tax_cents = apply_rate(subtotal_cents, to_basis_points(tax_rate))
+    item_count = sum(quantity for _, _, _, quantity in cent_lines)
+
+    conn = sqlite3.connect(db_path)
+    with conn:  # One transaction for the order, its lines and the rollups
+        c = conn.cursor()
+        c.execute(
+            "INSERT INTO orders (created_at, subtotal_cents, tax_cents, total_cents, item_count, tax_rate) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (created_at, subtotal_cents, tax_cents, subtotal_cents + tax_cents, item_count, tax_rate)
+        )
+        order_id = c.lastrowid
+        c.executemany(
+            "INSERT INTO order_items (order_id, item, category, price_cents, quantity) VALUES (?, ?, ?, ?, ?)",
+            [(order_id, *line) for line in cent_lines]
+        )
+        _add_to_rollups(c, created_at[:13], item_count, subtotal_cents, cent_lines)
+    conn.close()
+    return order_id
+
+
+def rebuild_rollups(db_path=ORDER_DB):
+    """Recompute both rollup tables from orders and order_items"""
+    conn = sqlite3.connect(db_path)
+    with conn:
+        c = conn.cursor()
+        c.execute("DELETE FROM sales_by_hour")
+        c.execute("DELETE FROM item_sales")
+        c.execute('''
+            INSERT INTO sales_by_hour (hour, orders, items, revenue_cents)
+            SELECT substr(created_at, 1, 13), COUNT(*), SUM(item_count), SUM(subtotal_cents)
+            FROM orders GROUP BY substr(created_at, 1, 13)
+        ''')
+        c.execute('''
+            INSERT INTO item_sales (item, category, quantity, revenue_cents)
+            SELECT item, MAX(category), SUM(quantity), SUM(price_cents * quantity)
+            FROM order_items GROUP BY item
+        ''')
+    conn.close()
+
+
+def get_hourly_revenue(since=None, db_path=ORDER_DB):
+    """Return (hour 'YYYY-MM-DDTHH', orders, items, revenue) from `since` onwards"""
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute(
+        "SELECT hour, orders, items, revenue_cents / 100.0 FROM sales_by_hour WHERE hour >= ? ORDER BY hour",
+        (since or '',)
+    )
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+
+def get_top_items(limit=10, db_path=ORDER_DB):
+    """Return (item, category, quantity, revenue) for the best sellers by revenue"""
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute(
+        "SELECT item, category, quantity, revenue_cents / 100.0 FROM item_sales "
+        "ORDER BY revenue_cents DESC, item LIMIT ?",
+        (limit,)
+    )
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+
+def get_sales_summary(db_path=ORDER_DB):
+    """Return (orders, revenue, average ticket) over every stored order"""
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute("SELECT COALESCE(SUM(orders), 0), COALESCE(SUM(revenue_cents), 0) FROM sales_by_hour")
+    orders, revenue_cents = c.fetchone()
+    conn.close()
+    return orders, revenue_cents / 100, (revenue_cents / orders / 100 if orders else 0.0)
+
+
+def get_recent_orders(limit=20, db_path=ORDER_DB):
+    """Return (id, created_at, item count, total) for the latest orders"""
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute(
+        "SELECT id, created_at, item_count, total_cents / 100.0 FROM orders ORDER BY created_at DESC, id DESC LIMIT ?",
+        (limit,)
+    )
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+
+def load_orders(since, until, db_path=ORDER_DB):
+    """Return the Orders created in [since, until) (ISO timestamps), oldest first"""
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute('''
+        SELECT o.id, o.created_at, o.tax_rate, o.subtotal_cents, o.tax_cents, o.total_cents,
+               i.item, i.price_cents, i.quantity
+        FROM orders o JOIN order_items i ON i.order_id = o.id
+        WHERE o.created_at >= ? AND o.created_at < ?
+        ORDER BY o.created_at, o.id, i.rowid
+    ''', (since, until))
+    rows = c.fetchall()
+    conn.close()
+
+    grouped = []
+    for order_id, created_at, tax_rate, subtotal, tax, total, item, price_cents, quantity in rows:
+        if not grouped or grouped[-1][0] != order_id:
+            grouped.append((order_id, created_at, tax_rate, (subtotal, tax, total), []))
+        grouped[-1][4].append((item, price_cents / 100, quantity))
+    return [Order(lines, tax_rate, created_at, order_id, stored_cents)
+            for order_id, created_at, tax_rate, stored_cents, lines in grouped]
+
+
+def reprice_orders(tax_rate, since='', until='9999', db_path=ORDER_DB):
+    """Recompute tax and total of every order in [since, until) at a new tax rate
+
+    Returns the number of orders updated. Subtotals (and so the rollups) are
+    unchanged by a tax change.
+    """
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute('''
+        SELECT o.id, i.price_cents, i.quantity
+        FROM orders o JOIN order_items i ON i.order_id = o.id
+        WHERE o.created_at >= ? AND o.created_at < ?
+        ORDER BY o.id
+    ''', (since, until))
+    rows = np.array(c.fetchall(), dtype=np.int64).reshape(-1, 3)
+    if not len(rows):
+        conn.close()
+        return 0
+
+    order_ids = rows[:, 0]
+    order_starts = np.flatnonzero(np.r_[True, order_ids[1:] != order_ids[:-1]])
+    _, _, taxes, totals = reprice(rows[:, 1], rows[:, 2], order_starts, to_basis_points(tax_rate))
+    with conn:
+        c.executemany(
+            "UPDATE orders SET tax_cents = ?, total_cents = ?, tax_rate = ? WHERE id = ?",
+            zip(taxes.tolist(), totals.tolist(), [tax_rate] * len(order_starts),
+                order_ids[order_starts].tolist())
+        )
+    conn.close()
+    return len(order_starts)
+
+
+def benchmark_dashboard(days=90, orders_per_day=400, db_path='order_benchmark.db', seed=0):
+    """Fill a scratch database with months of orders, then time rollup vs raw queries"""
+    import os
+    import random
+    from datetime import timedelta
+
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    init_order_db(db_path)
+
+    rng = random.Random(seed)
+    menu = [(f"Item {i}", round(rng.uniform(3, 25), 2)) for i in range(30)]
+    start_day = datetime(2024, 1, 1)
+    started = time.perf_counter()
+    for n in range(days * orders_per_day):
+        created_at = start_day + timedelta(minutes=n * 24 * 60 / orders_per_day)
+        lines = [(item, price, rng.randint(1, 3)) for item, price in rng.sample(menu, rng.randint(1, 5))]
+        save_order(lines, 0.08, created_at=created_at.isoformat(timespec='seconds'), db_path=db_path)
+    insert_rate = days * orders_per_day / (time.perf_counter() - started)
+
+    def timed_query(sql):
+        conn = sqlite3.connect(db_path)
+        started = time.perf_counter()
+        conn.execute(sql).fetchall()
+        elapsed = time.perf_counter() - started
+        conn.close()
+        return elapsed * 1000
+
+    print(f"{days * orders_per_day:,} orders over {days} days ({insert_rate:,.0f} orders/s stored)")
+    comparisons = {
+        'revenue per hour': (
+            "SELECT substr(created_at, 1, 13), SUM(subtotal_cents) FROM orders GROUP BY 1",
+            "SELECT hour, revenue_cents FROM sales_by_hour",
+        ),
+        'top items': (
+            "SELECT item, SUM(price_cents * quantity) AS r FROM order_items GROUP BY item ORDER BY r DESC LIMIT 10",
+            "SELECT item, revenue_cents FROM item_sales ORDER BY revenue_cents DESC LIMIT 10",
+        ),
+        'average ticket': (
+            "SELECT AVG(subtotal_cents) FROM orders",
+            "SELECT SUM(revenue_cents) * 1.0 / SUM(orders) FROM sales_by_hour",
+        ),
+    }
+    for name, (raw, rollup) in comparisons.items():
+        raw_ms, rollup_ms = timed_query(raw), timed_query(rollup)
+        print(f"{name:>16}: raw {raw_ms:8.2f} ms   rollup {rollup_ms:6.2f} ms   ({raw_ms / rollup_ms:,.0f}× faster)")
+    os.remove(db_path)
+
+
+if __name__ == "__main__":
+    benchmark_dashboard()
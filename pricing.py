@@ -0,0 +1,96 @@
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+
+# Exact pricing for the restaurant app. Money is integer cents and rates
+# (tax, discounts) are integer basis points, so a bill is computed without
+# floats at all:
+#   line total = price × quantity
+#   discount   = subtotal × discount rate, rounded half up to the cent
+#   tax        = (subtotal - discount) × tax rate, rounded half up to the cent
+# Carts are priced with NumPy arrays, and reprice() applies the same rules
+# to thousands of stored orders at once (e.g. after a tax change).
+
+BASIS_POINTS = 10_000
+
+
+def to_cents(amount):
+    """Dollars (float or str) -> integer cents, rounding half up"""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def to_basis_points(rate):
+    """A fractional rate such as 0.08 -> 800 basis points"""
+    return int((Decimal(str(rate)) * BASIS_POINTS).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def apply_rate(cents, basis_points):
+    """cents × rate rounded half up; works on ints and int64 arrays (amounts >= 0)"""
+    return (cents * basis_points + BASIS_POINTS // 2) // BASIS_POINTS
+
+
+def format_cents(cents):
+    sign = '-' if cents < 0 else ''
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}${dollars:,}.{cents:02d}"
+
+
+def price_bill(price_cents, quantities, tax_bp, discount_bp=0):
+    """Price one cart; return (line totals array, subtotal, discount, tax, total) in cents"""
+    line_totals = np.asarray(price_cents, dtype=np.int64) * np.asarray(quantities, dtype=np.int64)
+    subtotal = int(line_totals.sum())
+    discount = apply_rate(subtotal, discount_bp)
+    tax = apply_rate(subtotal - discount, tax_bp)
+    return line_totals, subtotal, discount, tax, subtotal - discount + tax
+
+
+def reprice(price_cents, quantities, order_starts, tax_bp, discount_bp=0):
+    """Price many orders at once from their concatenated lines
+
+    order_starts holds the index of each order's first line (every order has
+    at least one line). Returns int64 arrays (subtotal, discount, tax, total)
+    with one entry per order.
+    """
+    line_totals = np.asarray(price_cents, dtype=np.int64) * np.asarray(quantities, dtype=np.int64)
+    subtotals = np.add.reduceat(line_totals, np.asarray(order_starts, dtype=np.intp))
+    discounts = apply_rate(subtotals, discount_bp)
+    taxes = apply_rate(subtotals - discounts, tax_bp)
+    return subtotals, discounts, taxes, subtotals - discounts + taxes
+
+
+def benchmark_reprice(orders=200_000, seed=0):
+    """Re-price random orders with a Python loop and with reprice()"""
+    rng = np.random.default_rng(seed)
+    lines_per_order = rng.integers(1, 8, orders)
+    order_starts = np.concatenate(([0], np.cumsum(lines_per_order)[:-1]))
+    prices = rng.integers(199, 2999, int(lines_per_order.sum()))
+    quantities = rng.integers(1, 4, prices.size)
+    tax_bp = to_basis_points(0.0875)
+
+    start = time.perf_counter()
+    price_list, quantity_list = prices.tolist(), quantities.tolist()
+    ends = order_starts.tolist()[1:] + [prices.size]
+    loop_totals = []
+    for first, end in zip(order_starts.tolist(), ends):
+        subtotal = sum(p * q for p, q in zip(price_list[first:end], quantity_list[first:end]))
+        loop_totals.append(subtotal + apply_rate(subtotal, tax_bp))
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    totals = reprice(prices, quantities, order_starts, tax_bp)[3]
+    vector_seconds = time.perf_counter() - start
+
+    assert totals.tolist() == loop_totals
+    print(f"{orders:,} orders, {prices.size:,} lines")
+    print(f"  python loop: {loop_seconds * 1000:8.1f} ms ({orders / loop_seconds:12,.0f} orders/s)")
+    print(f"  reprice():   {vector_seconds * 1000:8.1f} ms ({orders / vector_seconds:12,.0f} orders/s)")
+
+    # Float drift on one large group bill, as calculate_totals() used to do it
+    float_total = sum([19.99] * 10_000) * 1.08
+    cents_total = price_bill([1999], [10_000], to_basis_points(0.08))[4]
+    print(f"  10,000 × $19.99 + 8% tax: floats {float_total!r}, cents {format_cents(cents_total)}")
+
+
+if __name__ == "__main__":
+    benchmark_reprice()
@@ -0,0 +1,148 @@
+import functools
+import threading
+import time
+from array import array
+
+from stopwatch_core import NS_PER_MS
+
+# Lightweight timing toolkit built on the stopwatch core.
+#
+#   with timed("build invoice") as t:   # context manager
+#       ...
+#       t.lap("table")                  # named split inside the block
+#
+#   @timed("db.add_workout")            # decorator
+#   def add_workout(...): ...
+#
+# Nested blocks are recorded under their full path ("outer > inner") and every
+# label keeps count/total/max plus a ring of recent samples for p50/p95.
+
+SAMPLE_SIZE = 1024
+
+
+class LabelStats:
+    """Aggregates for one label, with bounded memory"""
+
+    __slots__ = ('count', 'total_ns', 'max_ns', 'samples')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples = array('q')
+
+    def add(self, ns):
+        if len(self.samples) < SAMPLE_SIZE:
+            self.samples.append(ns)
+        else:
+            self.samples[self.count % SAMPLE_SIZE] = ns
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, fraction):
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Profiler:
+    """Thread-safe registry of timings by label"""
+
+    def __init__(self):
+        self.enabled = True
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def record(self, label, ns):
+        with self.lock:
+            stats = self.stats.get(label)
+            if stats is None:
+                stats = self.stats[label] = LabelStats()
+            stats.add(ns)
+
+    def stack(self):
+        """Labels of the timed blocks currently open on this thread"""
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+
+    def summary(self):
+        """One row per label with times in milliseconds, slowest total first"""
+        with self.lock:
+            rows = [
+                {
+                    'label': label,
+                    'count': stats.count,
+                    'total_ms': stats.total_ns / NS_PER_MS,
+                    'mean_ms': stats.total_ns / stats.count / NS_PER_MS,
+                    'p50_ms': stats.percentile(0.50) / NS_PER_MS,
+                    'p95_ms': stats.percentile(0.95) / NS_PER_MS,
+                    'max_ms': stats.max_ns / NS_PER_MS,
+                }
+                for label, stats in self.stats.items()
+            ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+
+PROFILER = Profiler()
+
+
+class timed:
+    """Time a block (context manager) or every call of a function (decorator)"""
+
+    def __init__(self, label, profiler=PROFILER):
+        self.label = label
+        self.profiler = profiler
+        self.path = label
+        self.started_ns = self.last_lap_ns = 0
+
+    def __enter__(self):
+        if self.profiler.enabled:
+            stack = self.profiler.stack()
+            self.path = f"{stack[-1]} > {self.label}" if stack else self.label
+            stack.append(self.path)
+            self.started_ns = self.last_lap_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.profiler.enabled and self.started_ns:
+            self.profiler.record(self.path, time.perf_counter_ns() - self.started_ns)
+            self.profiler.stack().pop()
+        return False
+
+    def lap(self, name):
+        """Record the time since the block started or since the previous lap"""
+        if self.profiler.enabled and self.started_ns:
+            now = time.perf_counter_ns()
+            self.profiler.record(f"{self.path} / {name}", now - self.last_lap_ns)
+            self.last_lap_ns = now
+
+    def __call__(self, func):
+        label, profiler = self.label, self.profiler
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(label, profiler):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def render_timing_panel(profiler=PROFILER, title="⏱️ Timings"):
+    """Show the collected timings in a Streamlit expander"""
+    import streamlit as st
+
+    with st.expander(title):
+        rows = profiler.summary()
+        if not rows:
+            st.caption("Nothing has been timed yet.")
+            return
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        if st.button("Clear timings", key=f"clear_timings_{id(profiler)}"):
+            profiler.reset()
+            st.rerun()
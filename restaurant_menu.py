@@ -0,0 +1,74 @@
+# Restaurant menu shared by the Streamlit app (day11_resorder_bill.py) and the
+# background jobs, which can't import the app script itself.
+
+MENU = {
+    "🍔 Burgers": {
+        "Classic Burger": 12.99,
+        "Cheeseburger": 14.99,
+        "Bacon Deluxe": 16.99,
+        "Veggie Burger": 13.99,
+        "Double Whopper": 19.99
+    },
+    "🍕 Pizza": {
+        "Margherita": 15.99,
+        "Pepperoni": 17.99,
+        "Supreme": 21.99,
+        "Hawaiian": 18.99,
+        "Veggie Delight": 19.99
+    },
+    "🍝 Pasta": {
+        "Spaghetti Carbonara": 16.99,
+        "Chicken Alfredo": 18.99,
+        "Penne Arrabbiata": 15.99,
+        "Lasagna": 19.99,
+        "Seafood Linguine": 22.99
+    },
+    "🥗 Salads": {
+        "Caesar Salad": 11.99,
+        "Greek Salad": 12.99,
+        "Cobb Salad": 14.99,
+        "Quinoa Bowl": 13.99,
+        "Garden Fresh": 10.99
+    },
+    "🥤 Beverages": {
+        "Soft Drink": 2.99,
+        "Fresh Juice": 4.99,
+        "Coffee": 3.99,
+        "Beer": 5.99,
+        "Wine (Glass)": 7.99
+    },
+    "🍰 Desserts": {
+        "Chocolate Cake": 7.99,
+        "Tiramisu": 8.99,
+        "Ice Cream": 5.99,
+        "Cheesecake": 8.99,
+        "Apple Pie": 6.99
+    }
+}
+
+# Item -> category, stored with each order line
+ITEM_CATEGORY = {item: category for category, items in MENU.items() for item in items}
+
+# Tax rate (adjustable)
+TAX_RATE = 0.08  # 8%
+
+# (item, price) for every menu item
+MENU_ITEMS = [(item, price) for items in MENU.values() for item, price in items.items()]
+
+# Lower-cased "name\ncategory" keys built once, so searching a large menu is a
+# single pass of substring checks with no per-query normalisation of the menu
+# (and "pizza" finds everything in the Pizza category)
+SEARCH_INDEX = [(f"{item}\n{category}".casefold(), item, category, price)
+                for category, items in MENU.items() for item, price in items.items()]
+
+
+def search_menu(query, limit=50):
+    """Return up to `limit` (item, category, price) whose name or category contains query"""
+    needle = query.strip().casefold()
+    matches = []
+    for key, item, category, price in SEARCH_INDEX:
+        if needle in key:
+            matches.append((item, category, price))
+            if len(matches) == limit:
+                break
+    return matches
@@ -0,0 +1,84 @@
+import random
+from array import array
+
+from rps_engine import CLASSIC
+
+# Adaptive rock-paper-scissors opponent.
+# Predicts the player's next move from what they played after the same recent
+# moves before, using fixed-size count tables for every context length up to
+# `order`. Each round updates one counter per table, so the work per round and
+# the memory per session stay constant however long someone plays.
+
+# Counts saturate here and the row is halved, so old habits fade out
+COUNT_LIMIT = 255
+
+# Observations a context needs before its prediction is trusted
+MIN_EVIDENCE = 3
+
+# Largest count table per context length, which caps the order for big variants
+MAX_TABLE_ENTRIES = 1 << 16
+
+
+def max_order(num_moves, order=3):
+    """Highest context length up to `order` whose table fits MAX_TABLE_ENTRIES"""
+    while order > 0 and num_moves ** (order + 1) > MAX_TABLE_ENTRIES:
+        order -= 1
+    return order
+
+
+class MarkovPredictor:
+    """Order-k Markov model over the player's move history"""
+
+    def __init__(self, order=3, num_moves=3):
+        self.order = order
+        self.num_moves = num_moves
+        # tables[k][context * num_moves + move]: times `move` followed the last k moves
+        self.tables = [array('B', bytes(num_moves ** k * num_moves)) for k in range(order + 1)]
+        self.history = 0  # Last `order` moves as a base-num_moves number
+        self.rounds = 0
+
+    def _context(self, k):
+        return self.history % (self.num_moves ** k)
+
+    def observe(self, move):
+        """Record the player's move index"""
+        n = self.num_moves
+        for k, table in enumerate(self.tables):
+            if k > self.rounds:
+                break  # Not enough history for this context length yet
+            row = self._context(k) * n
+            if table[row + move] == COUNT_LIMIT:
+                for i in range(row, row + n):
+                    table[i] >>= 1
+            table[row + move] += 1
+
+        self.history = (self.history * n + move) % (n ** self.order)
+        self.rounds += 1
+
+    def predict(self):
+        """Most likely next player move index, or None without enough evidence"""
+        n = self.num_moves
+        # Prefer the longest context that has been seen often enough
+        for k in range(min(self.order, self.rounds), -1, -1):
+            row = self._context(k) * n
+            counts = self.tables[k][row:row + n]
+            if sum(counts) >= MIN_EVIDENCE:
+                best = max(counts)
+                return random.choice([i for i, c in enumerate(counts) if c == best])
+        return None
+
+    def memory_bytes(self):
+        return sum(len(table) * table.itemsize for table in self.tables)
+
+
+def counter_move(move, variant=CLASSIC):
+    """The move that beats `move` (Paper beats Rock, Scissors beat Paper, ...)"""
+    return variant.counter(move)
+
+
+def adaptive_choice(predictor, variant=CLASSIC):
+    """Computer choice that beats the predicted player move"""
+    predicted = predictor.predict()
+    if predicted is None:
+        return random.choice(variant.moves)
+    return variant.moves[counter_move(predicted, variant)]
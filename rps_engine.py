@@ -0,0 +1,83 @@
+# Rock-paper-scissors rules, shared by the app and the batch simulator.
+#
+# Any odd number of moves works: with h = (n - 1) / 2, move i beats move j when
+# ((i - j) * step) % n is between 1 and h, so every move beats exactly h others
+# and scoring a round is O(1) whatever the variant.
+
+# Round results, in the order used by outcome codes
+RESULTS = ['tie', 'user', 'computer']
+TIE, USER, COMPUTER = range(3)
+
+EMOJIS = {
+    'Rock': '🪨', 'Paper': '📄', 'Scissors': '✂️', 'Lizard': '🦎', 'Spock': '🖖',
+    'Fire': '🔥', 'Sponge': '🧽', 'Air': '💨', 'Water': '💧', 'Snake': '🐍',
+    'Human': '🧍', 'Tree': '🌳', 'Wolf': '🐺', 'Dragon': '🐉', 'Devil': '😈',
+    'Lightning': '⚡', 'Gun': '🔫',
+}
+
+
+class Variant:
+    """A rock-paper-scissors style game with an odd number of moves"""
+
+    def __init__(self, name, moves, step=1, description=None):
+        if len(moves) % 2 == 0:
+            raise ValueError("A fair variant needs an odd number of moves")
+        self.name = name
+        self.description = description  # Shown under the variant picker
+        self.moves = list(moves)
+        self.move_index = {move: i for i, move in enumerate(self.moves)}
+        self.size = len(self.moves)
+        self.step = step
+        self.half = (self.size - 1) // 2
+        # Offset from a move to the one that beats it by the smallest margin
+        self.counter_offset = pow(step, -1, self.size)
+        # outcome_matrix[user][computer] holds result codes, for batch scoring
+        self.outcome_matrix = [
+            [self.outcome(user, computer) for computer in range(self.size)]
+            for user in range(self.size)
+        ]
+
+    def outcome(self, user, computer):
+        """Result code (TIE, USER or COMPUTER) for two move indices"""
+        distance = (user - computer) * self.step % self.size
+        if distance == 0:
+            return TIE
+        return USER if distance <= self.half else COMPUTER
+
+    def counter(self, move):
+        """A move index that beats `move`"""
+        return (move + self.counter_offset) % self.size
+
+    def emoji(self, move):
+        return EMOJIS.get(move, '🔹')
+
+
+VARIANTS = {
+    variant.name: variant for variant in [
+        Variant('Rock-Paper-Scissors', ['Rock', 'Paper', 'Scissors']),
+        Variant('Rock-Paper-Scissors-Lizard-Spock', ['Rock', 'Paper', 'Scissors', 'Spock', 'Lizard'], step=2),
+        # The RPS-7/15 lists are ordered so that each move beats the next h
+        Variant('RPS-7', ['Rock', 'Fire', 'Scissors', 'Sponge', 'Paper', 'Air', 'Water'], step=-1),
+        Variant('RPS-15', ['Rock', 'Fire', 'Scissors', 'Snake', 'Human', 'Tree', 'Wolf', 'Sponge',
+                           'Paper', 'Air', 'Water', 'Dragon', 'Devil', 'Lightning', 'Gun'], step=-1),
+        Variant('RPS-101', [f'Move {i}' for i in range(1, 102)], step=-1,
+                description="An abstract 101-move variant: moves are numbered, and each one beats "
+                            "the 50 that follow it (wrapping around from Move 101 to Move 1)."),
+    ]
+}
+
+CLASSIC = VARIANTS['Rock-Paper-Scissors']
+
+
+def determine_winner(user_choice, computer_choice, variant=CLASSIC):
+    """Determine the winner of the game"""
+    result = variant.outcome(variant.move_index[user_choice], variant.move_index[computer_choice])
+    return RESULTS[result]
+
+
+def win_rates(user_score, computer_score, games_played):
+    """Win and tie percentages as shown in the app: (user, computer, tie)"""
+    user_win_rate = (user_score / games_played) * 100
+    computer_win_rate = (computer_score / games_played) * 100
+    tie_rate = 100 - user_win_rate - computer_win_rate
+    return user_win_rate, computer_win_rate, tie_rate
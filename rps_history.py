@@ -0,0 +1,167 @@
+import os
+import re
+import struct
+import threading
+import time
+from array import array
+
+from rps_engine import COMPUTER, USER
+
+# Lifetime round history for rock-paper-scissors, one set of files per variant:
+#   <variant>.log    every round, packed: user << 4 | computer in one byte
+#                    (variants above 16 moves use two bytes: user * n + computer)
+#   <variant>.ts     one uint32 Unix timestamp per block of BLOCK_SIZE rounds
+#   <variant>.stats  running aggregates, rewritten after every round
+# The result of a round is derived from the two moves, so it is not stored.
+# Displaying lifetime stats only reads the aggregates, never the log.
+
+HISTORY_DIR = 'rps_history'
+BLOCK_SIZE = 256
+
+# rounds, user wins, computer wins, ties, current streak (+wins / -losses),
+# longest win streak, longest losing streak; then one count per user move
+STATS_HEADER = struct.Struct('<QQQQqQQ')
+
+
+def _slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+class RoundHistory:
+    """Append-only round log with incrementally maintained lifetime stats"""
+
+    def __init__(self, variant, directory=HISTORY_DIR):
+        self.variant = variant
+        self.typecode = 'B' if variant.size <= 16 else 'H'
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, _slug(variant.name))
+        self.log_path = base + '.log'
+        self.timestamps_path = base + '.ts'
+        self.stats_path = base + '.stats'
+        self.lock = threading.Lock()
+        self._load_stats()
+
+    # Packing
+    def _pack(self, user, computer):
+        if self.typecode == 'B':
+            return user << 4 | computer
+        return user * self.variant.size + computer
+
+    def _unpack(self, code):
+        if self.typecode == 'B':
+            return code >> 4, code & 0x0F
+        return divmod(code, self.variant.size)
+
+    def _logged_rounds(self):
+        try:
+            return os.path.getsize(self.log_path) // array(self.typecode).itemsize
+        except OSError:
+            return 0
+
+    # Aggregates
+    def _reset_stats(self):
+        self.rounds = self.user_wins = self.computer_wins = self.ties = 0
+        self.streak = self.best_win_streak = self.best_loss_streak = 0
+        self.move_counts = array('Q', bytes(8 * self.variant.size))
+
+    def _load_stats(self):
+        self._reset_stats()
+        try:
+            with open(self.stats_path, 'rb') as f:
+                data = f.read()
+            (self.rounds, self.user_wins, self.computer_wins, self.ties, self.streak,
+             self.best_win_streak, self.best_loss_streak) = STATS_HEADER.unpack_from(data)
+            self.move_counts = array('Q', data[STATS_HEADER.size:])
+        except (OSError, struct.error, ValueError):
+            self._reset_stats()
+
+        # A crash between appending a round and saving stats leaves them out of step
+        if self.rounds != self._logged_rounds() or len(self.move_counts) != self.variant.size:
+            self.rebuild_stats()
+
+    def _save_stats(self):
+        header = STATS_HEADER.pack(
+            self.rounds, self.user_wins, self.computer_wins, self.ties, self.streak,
+            self.best_win_streak, self.best_loss_streak
+        )
+        tmp_path = self.stats_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(header + self.move_counts.tobytes())
+        os.replace(tmp_path, self.stats_path)
+
+    def _apply(self, user, computer):
+        """Fold one round into the running aggregates — O(1)"""
+        result = self.variant.outcome(user, computer)
+        self.rounds += 1
+        self.move_counts[user] += 1
+        if result == USER:
+            self.user_wins += 1
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+            self.best_win_streak = max(self.best_win_streak, self.streak)
+        elif result == COMPUTER:
+            self.computer_wins += 1
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+            self.best_loss_streak = max(self.best_loss_streak, -self.streak)
+        else:
+            self.ties += 1
+            self.streak = 0
+        return result
+
+    def rebuild_stats(self):
+        """Recompute the aggregates from the full log"""
+        self._reset_stats()
+        for user, computer in self.iter_rounds():
+            self._apply(user, computer)
+        self._save_stats()
+
+    # Public API
+    def record(self, user, computer, timestamp=None):
+        """Append a round (move indices) and update the lifetime stats"""
+        with self.lock:
+            if self.rounds % BLOCK_SIZE == 0:
+                with open(self.timestamps_path, 'ab') as f:
+                    array('I', [int(time.time() if timestamp is None else timestamp)]).tofile(f)
+            with open(self.log_path, 'ab') as f:
+                array(self.typecode, [self._pack(user, computer)]).tofile(f)
+            result = self._apply(user, computer)
+            self._save_stats()
+            return result
+
+    def iter_rounds(self):
+        """Yield (user, computer) move indices for every logged round"""
+        codes = array(self.typecode)
+        try:
+            with open(self.log_path, 'rb') as f:
+                codes.frombytes(f.read())
+        except OSError:
+            return
+        for code in codes:
+            yield self._unpack(code)
+
+    def block_start_times(self):
+        """Unix time at which each block of BLOCK_SIZE rounds started"""
+        timestamps = array('I')
+        try:
+            with open(self.timestamps_path, 'rb') as f:
+                timestamps.frombytes(f.read())
+        except OSError:
+            pass
+        return timestamps
+
+    def stats(self):
+        """Lifetime statistics from the running aggregates"""
+        rounds = self.rounds
+        return {
+            'rounds': rounds,
+            'user_wins': self.user_wins,
+            'computer_wins': self.computer_wins,
+            'ties': self.ties,
+            'win_rate': self.user_wins / rounds * 100 if rounds else 0.0,
+            'current_streak': self.streak,
+            'best_win_streak': self.best_win_streak,
+            'best_loss_streak': self.best_loss_streak,
+            'move_distribution': {
+                move: self.move_counts[i] / rounds * 100 if rounds else 0.0
+                for i, move in enumerate(self.variant.moves)
+            },
+        }
@@ -0,0 +1,143 @@
+import argparse
+import time
+
+import numpy as np
+
+from rps_ai import MarkovPredictor, max_order
+from rps_engine import CLASSIC, COMPUTER, RESULTS, TIE, USER, VARIANTS, win_rates
+
+# Batch rock-paper-scissors simulation, for any variant in rps_engine.
+# Strategies produce whole arrays of moves and every round is scored with one
+# lookup into the variant's outcome matrix, so millions of rounds take a
+# single vectorized call.
+
+MOVE_DTYPE = np.int16  # Enough for RPS-101
+_outcome_arrays = {}
+
+
+def outcome_array(variant):
+    """The variant's outcome matrix as a NumPy array (built once per variant)"""
+    if variant.name not in _outcome_arrays:
+        _outcome_arrays[variant.name] = np.array(variant.outcome_matrix, dtype=np.int8)
+    return _outcome_arrays[variant.name]
+
+
+def score_rounds(user_moves, computer_moves, variant=CLASSIC):
+    """Score aligned move arrays; returns the same statistics the app shows"""
+    counts = np.bincount(outcome_array(variant)[user_moves, computer_moves], minlength=len(RESULTS))
+    ties, user_score, computer_score = int(counts[TIE]), int(counts[USER]), int(counts[COMPUTER])
+    games_played = ties + user_score + computer_score
+
+    user_win_rate, computer_win_rate, tie_rate = win_rates(user_score, computer_score, games_played)
+    return {
+        'user_score': user_score,
+        'computer_score': computer_score,
+        'games_played': games_played,
+        'user_win_rate': user_win_rate,
+        'computer_win_rate': computer_win_rate,
+        'tie_rate': tie_rate,
+    }
+
+
+# Strategies: strategy(rng, rounds, variant, opponent_moves) -> array of move indices.
+# opponent_moves is None for the side generated first; reactive strategies
+# need it and may only look at earlier rounds.
+
+def uniform(rng, rounds, variant, opponent_moves=None):
+    return rng.integers(0, variant.size, rounds, dtype=MOVE_DTYPE)
+
+
+def first_move_bias(weight=2.0):
+    """Plays the variant's first move (Rock) `weight` times as often as each other move"""
+    def strategy(rng, rounds, variant, opponent_moves=None):
+        p = np.ones(variant.size)
+        p[0] = weight
+        return rng.choice(variant.size, size=rounds, p=p / p.sum()).astype(MOVE_DTYPE)
+    return strategy
+
+
+def cycle(start=0):
+    """Rock, Paper, Scissors, Rock, ..."""
+    def strategy(rng, rounds, variant, opponent_moves=None):
+        return ((np.arange(rounds) + start) % variant.size).astype(MOVE_DTYPE)
+    return strategy
+
+
+def sticky(repeat_probability=0.6):
+    """Repeat the previous move with the given probability, otherwise pick fresh"""
+    def strategy(rng, rounds, variant, opponent_moves=None):
+        fresh = rng.integers(0, variant.size, rounds, dtype=MOVE_DTYPE)
+        changes = rng.random(rounds) >= repeat_probability
+        changes[0] = True
+        # Each round copies the move from the most recent change
+        last_change = np.maximum.accumulate(np.where(changes, np.arange(rounds), 0))
+        return fresh[last_change]
+    return strategy
+
+
+def beat_last(rng, rounds, variant, opponent_moves):
+    """Play whatever beats the opponent's previous move"""
+    moves = np.empty(rounds, dtype=MOVE_DTYPE)
+    moves[0] = rng.integers(0, variant.size)
+    moves[1:] = (opponent_moves[:-1] + variant.counter_offset) % variant.size
+    return moves
+
+
+def adaptive(order=3):
+    """The app's Markov opponent; inherently sequential, so much slower per round"""
+    def strategy(rng, rounds, variant, opponent_moves):
+        predictor = MarkovPredictor(max_order(variant.size, order), variant.size)
+        fallback = rng.integers(0, variant.size, rounds, dtype=MOVE_DTYPE)
+        moves = np.empty(rounds, dtype=MOVE_DTYPE)
+        for i, opponent_move in enumerate(opponent_moves.tolist()):
+            predicted = predictor.predict()
+            moves[i] = fallback[i] if predicted is None else variant.counter(predicted)
+            predictor.observe(opponent_move)
+        return moves
+    return strategy
+
+
+STRATEGIES = {
+    'uniform': uniform,
+    'rock-heavy': first_move_bias(),
+    'cycle': cycle(),
+    'sticky': sticky(),
+    'beat-last': beat_last,
+    'adaptive': adaptive(),
+}
+
+# Strategies that react to the opponent, and so must be generated second
+REACTIVE = {'beat-last', 'adaptive'}
+
+
+def simulate(user_strategy, computer_strategy, rounds, variant=CLASSIC, seed=None):
+    """Play `rounds` rounds and return the statistics from score_rounds()"""
+    rng = np.random.default_rng(seed)
+    user_moves = user_strategy(rng, rounds, variant, None)
+    computer_moves = computer_strategy(rng, rounds, variant, user_moves)
+    return score_rounds(user_moves, computer_moves, variant)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rock-paper-scissors strategy tournament")
+    parser.add_argument('--rounds', type=int, default=1_000_000)
+    parser.add_argument('--variant', default=CLASSIC.name, choices=list(VARIANTS))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    variant = VARIANTS[args.variant]
+
+    print(f"{'player':>11} {'computer':>11} {'player %':>9} {'computer %':>11} {'tie %':>7} {'rounds/s':>12}")
+    for user_name, user_strategy in STRATEGIES.items():
+        if user_name in REACTIVE:
+            continue
+        for computer_name, computer_strategy in STRATEGIES.items():
+            start = time.perf_counter()
+            stats = simulate(user_strategy, computer_strategy, args.rounds, variant, args.seed)
+            elapsed = time.perf_counter() - start
+            print(f"{user_name:>11} {computer_name:>11} {stats['user_win_rate']:>8.1f}% "
+                  f"{stats['computer_win_rate']:>10.1f}% {stats['tie_rate']:>6.1f}% "
+                  f"{args.rounds / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
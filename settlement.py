@@ -0,0 +1,120 @@
+import argparse
+import heapq
+import random
+import time
+
+from split_engine import weighted_shares
+
+# Settling up a shared expense in integer cents (day2_expensetracker.py).
+# Balances are contribution minus fair share; positive means the person is
+# owed money. settle() pays them off with few transfers:
+#   1. a debtor and a creditor with exactly the same amount settle in one
+#      transfer that clears both
+#   2. the rest is greedy: the largest debtor pays the largest creditor,
+#      and whoever is left with a remainder goes back on its heap
+# Every transfer clears at least one person, so there are at most n - 1 of
+# them, found in O(n log n). (A guaranteed minimum is NP-hard.)
+
+
+def split_cents(total_cents, count):
+    """Fair shares that add up exactly: the first total % count people pay a cent more"""
+    return weighted_shares(total_cents, count=count).tolist()
+
+
+def settle(balances):
+    """Transfers that zero out balances (cents, summing to 0)
+
+    Returns [(debtor index, creditor index, cents), ...].
+    """
+    if sum(balances) != 0:
+        raise ValueError("Balances must sum to zero")
+
+    transfers = []
+    # 1. Exact matches
+    creditors_by_amount = {}
+    for i, balance in enumerate(balances):
+        if balance > 0:
+            creditors_by_amount.setdefault(balance, []).append(i)
+    matched = set()
+    for i, balance in enumerate(balances):
+        if balance < 0 and creditors_by_amount.get(-balance):
+            creditor = creditors_by_amount[-balance].pop()
+            transfers.append((i, creditor, -balance))
+            matched.update((i, creditor))
+
+    # 2. Greedy on max-heaps (heapq is a min-heap, so amounts are negated)
+    creditors = [(-balance, i) for i, balance in enumerate(balances) if balance > 0 and i not in matched]
+    debtors = [(balance, i) for i, balance in enumerate(balances) if balance < 0 and i not in matched]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+    while debtors:
+        debt, debtor = heapq.heappop(debtors)
+        credit, creditor = heapq.heappop(creditors)
+        amount = min(-debt, -credit)
+        transfers.append((debtor, creditor, amount))
+        if -debt > amount:
+            heapq.heappush(debtors, (debt + amount, debtor))
+        elif -credit > amount:
+            heapq.heappush(creditors, (credit + amount, creditor))
+    return transfers
+
+
+def legacy_settle(balances):
+    """The app's previous algorithm on float dollars: O(debtors × creditors)"""
+    people = [{"balance": balance} for balance in balances]
+    creditors = [p for p in people if p["balance"] > 0]
+    debtors = [p for p in people if p["balance"] < 0]
+    creditors.sort(key=lambda x: x["balance"], reverse=True)
+    debtors.sort(key=lambda x: x["balance"])
+
+    transfers = []
+    for debtor in debtors:
+        debt_amount = abs(debtor["balance"])
+        for creditor in creditors:
+            if creditor["balance"] > 0 and debt_amount > 0:
+                payment_amount = min(creditor["balance"], debt_amount)
+                if payment_amount > 0:
+                    transfers.append(payment_amount)
+                    creditor["balance"] -= payment_amount
+                    debt_amount -= payment_amount
+    return transfers
+
+
+def random_balances(people, seed=0):
+    """Cent balances for a group where a third of the people paid for everything"""
+    rng = random.Random(seed)
+    contributions = [rng.randint(1_000, 50_000) if rng.random() < 0.33 else 0 for _ in range(people)]
+    shares = split_cents(sum(contributions), people)
+    return [paid - share for paid, share in zip(contributions, shares)]
+
+
+def benchmark(sizes, legacy_limit):
+    print(f"{'people':>8} {'heap ms':>9} {'transfers':>10} {'legacy ms':>10} {'transfers':>10} {'< 1¢':>6}")
+    for people in sizes:
+        balances = random_balances(people)
+        start = time.perf_counter()
+        transfers = settle(balances)
+        heap_ms = (time.perf_counter() - start) * 1000
+
+        legacy = ''
+        if people <= legacy_limit:
+            dollars = [balance / 100 for balance in balances]
+            start = time.perf_counter()
+            legacy_transfers = legacy_settle(dollars)
+            legacy_ms = (time.perf_counter() - start) * 1000
+            residues = sum(1 for amount in legacy_transfers if amount < 0.005)
+            legacy = f"{legacy_ms:10.1f} {len(legacy_transfers):10,} {residues:6,}"
+        print(f"{people:8,} {heap_ms:9.1f} {len(transfers):10,} {legacy}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Settlement engine benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 5_000, 20_000, 100_000])
+    parser.add_argument('--legacy-limit', type=int, default=20_000,
+                        help="largest group to run the old O(D*C) algorithm on")
+    args = parser.parse_args()
+    benchmark(args.sizes, args.legacy_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import random
+
+# Directions as (row, col) deltas; the index is what gets recorded in replays
+UP = (-1, 0)
+DOWN = (1, 0)
+LEFT = (0, -1)
+RIGHT = (0, 1)
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+DIRECTION_INDEX = {d: i for i, d in enumerate(DIRECTIONS)}
+
+
+class SnakeEngine:
+    """Deterministic snake game logic, independent of Streamlit
+
+    All randomness comes from a private random.Random seeded at construction,
+    so the same seed plus the same sequence of direction changes and ticks
+    always produces the same game.
+    """
+
+    def __init__(self, seed=None, board_size=20):
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.board_size = board_size
+        self.rng = random.Random(seed)
+        mid = board_size // 2
+        self.snake = [(mid, mid), (mid, mid - 1), (mid, mid - 2)]  # Head at index 0
+        self.occupied = set(self.snake)
+        self.direction = RIGHT
+        self.score = 0
+        self.ticks = 0
+        self.game_over = False
+        self.food = self.generate_food()
+
+    def generate_food(self):
+        """Generate food at a random position not occupied by snake"""
+        while True:
+            food_pos = (
+                self.rng.randint(0, self.board_size - 1),
+                self.rng.randint(0, self.board_size - 1)
+            )
+            if food_pos not in self.occupied:
+                return food_pos
+
+    def change_direction(self, new_direction):
+        """Change direction if valid; return True when the change was accepted"""
+        if new_direction == self.direction:
+            return False
+        # Prevent reversing into itself
+        if (new_direction[0] * -1, new_direction[1] * -1) == self.direction:
+            return False
+        self.direction = new_direction
+        return True
+
+    def step(self):
+        """Advance the game by one tick; return False once the game is over"""
+        if self.game_over:
+            return False
+
+        self.ticks += 1
+        head = self.snake[0]
+        new_head = (head[0] + self.direction[0], head[1] + self.direction[1])
+
+        # Check wall collision
+        if not (0 <= new_head[0] < self.board_size and 0 <= new_head[1] < self.board_size):
+            self.game_over = True
+            return False
+
+        # Check self collision
+        if new_head in self.occupied:
+            self.game_over = True
+            return False
+
+        # Move snake
+        self.snake.insert(0, new_head)
+        self.occupied.add(new_head)
+
+        # Check food collision
+        if new_head == self.food:
+            self.score += 10
+            self.food = self.generate_food()
+        else:
+            # Remove tail if no food eaten
+            self.occupied.discard(self.snake.pop())
+        return True
+
+    def snapshot(self):
+        """Return a copy of the full game state, including the RNG position"""
+        return {
+            'snake': list(self.snake),
+            'direction': self.direction,
+            'food': self.food,
+            'score': self.score,
+            'ticks': self.ticks,
+            'game_over': self.game_over,
+            'rng_state': self.rng.getstate(),
+        }
+
+    def restore(self, state):
+        """Restore a state previously produced by snapshot()"""
+        self.snake = list(state['snake'])
+        self.occupied = set(self.snake)
+        self.direction = state['direction']
+        self.food = state['food']
+        self.score = state['score']
+        self.ticks = state['ticks']
+        self.game_over = state['game_over']
+        self.rng.setstate(state['rng_state'])
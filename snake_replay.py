@@ -0,0 +1,207 @@
+import sqlite3
+import struct
+import time
+from array import array
+from datetime import datetime
+
+from snake_engine import SnakeEngine, DIRECTIONS, DIRECTION_INDEX
+
+# Recording layout:
+#   header: magic, format version, board size, 64-bit RNG seed
+#   body:   one byte per run -> (direction index << 6) | ticks in that run (0-63)
+# A new byte starts on every accepted direction change, and a long straight
+# run is split every 63 ticks, so a typical game costs well under a byte per tick.
+MAGIC = b'SNK1'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('>4sBBQ')
+MAX_RUN = 0x3F
+
+REPLAY_DB = 'snake_replays.db'
+
+
+class ReplayRecorder:
+    """Record a SnakeEngine game as a compact binary log"""
+
+    def __init__(self, engine):
+        self.seed = engine.seed
+        self.board_size = engine.board_size
+        self.events = bytearray()
+        self.pending_dir = DIRECTION_INDEX[engine.direction]
+        self.pending_ticks = 0
+
+    def _flush(self):
+        if self.pending_ticks:
+            self.events.append((self.pending_dir << 6) | self.pending_ticks)
+            self.pending_ticks = 0
+
+    def record_direction(self, direction):
+        """Record an accepted direction change (call after the engine accepted it)"""
+        self._flush()
+        self.pending_dir = DIRECTION_INDEX[direction]
+
+    def record_tick(self):
+        """Record one engine tick in the current direction"""
+        self.pending_ticks += 1
+        if self.pending_ticks == MAX_RUN:
+            self._flush()
+
+    def to_bytes(self):
+        """Return the finished recording"""
+        self._flush()
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, self.board_size, self.seed)
+        return header + bytes(self.events)
+
+
+def decode_replay(data):
+    """Decode a recording into (seed, board_size, per-tick direction indices)"""
+    magic, version, board_size, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a snake replay recording")
+
+    directions = array('B')
+    for byte in memoryview(data)[HEADER.size:]:
+        directions.extend(array('B', [byte >> 6]) * (byte & MAX_RUN))
+    return seed, board_size, directions
+
+
+class ReplayPlayer:
+    """Deterministic, seekable playback of a recording through SnakeEngine
+
+    A snapshot of the engine is kept every `snapshot_every` ticks as playback
+    moves forward, so seeking only re-simulates from the nearest snapshot.
+    """
+
+    def __init__(self, data, snapshot_every=256):
+        self.seed, self.board_size, self.directions = decode_replay(data)
+        self.snapshot_every = snapshot_every
+        self.engine = SnakeEngine(self.seed, self.board_size)
+        self.snapshots = [self.engine.snapshot()]
+
+    @property
+    def total_ticks(self):
+        return len(self.directions)
+
+    def step(self):
+        """Play one tick; return False at the end of the recording"""
+        engine = self.engine
+        if engine.game_over or engine.ticks >= self.total_ticks:
+            return False
+
+        engine.direction = DIRECTIONS[self.directions[engine.ticks]]
+        engine.step()
+        if engine.ticks % self.snapshot_every == 0 and engine.ticks // self.snapshot_every == len(self.snapshots):
+            self.snapshots.append(engine.snapshot())
+        return True
+
+    def seek(self, tick):
+        """Move playback to the given tick and return the engine"""
+        tick = max(0, min(tick, self.total_ticks))
+        nearest = min(tick // self.snapshot_every, len(self.snapshots) - 1)
+
+        # Only rewind to a snapshot if stepping forward from here is not shorter
+        if not (nearest * self.snapshot_every <= self.engine.ticks <= tick):
+            self.engine.restore(self.snapshots[nearest])
+
+        while self.engine.ticks < tick and self.step():
+            pass
+        return self.engine
+
+    def run_to_end(self):
+        """Play the rest of the recording and return the final engine state"""
+        while self.step():
+            pass
+        return self.engine
+
+
+def verify_replay(data, claimed_score):
+    """Re-simulate a recording and check it really produced the claimed score"""
+    engine = ReplayPlayer(data).run_to_end()
+    return engine.game_over and engine.score == claimed_score
+
+
+# Replay storage
+def init_replay_db(db_path=REPLAY_DB):
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS replays (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            ticks INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+    ''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_replays_score ON replays (score DESC)")
+
+    conn.commit()
+    conn.close()
+
+
+def save_replay(data, score, ticks, db_path=REPLAY_DB):
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute(
+        "INSERT INTO replays (created_at, score, ticks, data) VALUES (?, ?, ?, ?)",
+        (datetime.now().isoformat(timespec='seconds'), score, ticks, sqlite3.Binary(data))
+    )
+    replay_id = c.lastrowid
+    conn.commit()
+    conn.close()
+    return replay_id
+
+
+def get_top_replays(limit=10, db_path=REPLAY_DB):
+    """Return (id, created_at, score, ticks, size in bytes) for the best runs"""
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute(
+        "SELECT id, created_at, score, ticks, length(data) FROM replays ORDER BY score DESC, id ASC LIMIT ?",
+        (limit,)
+    )
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+
+def load_replay(replay_id, db_path=REPLAY_DB):
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute("SELECT data FROM replays WHERE id = ?", (replay_id,))
+    row = c.fetchone()
+    conn.close()
+    return bytes(row[0]) if row else None
+
+
+def benchmark_replay(games=200, seed=0):
+    """Record random games, then replay them and report playback speed"""
+    import random
+
+    rng = random.Random(seed)
+    recordings = []
+    for _ in range(games):
+        engine = SnakeEngine(rng.getrandbits(64))
+        recorder = ReplayRecorder(engine)
+        while not engine.game_over:
+            if rng.random() < 0.2 and engine.change_direction(rng.choice(DIRECTIONS)):
+                recorder.record_direction(engine.direction)
+            engine.step()
+            recorder.record_tick()
+        recordings.append((recorder.to_bytes(), engine.score, engine.ticks))
+
+    total_ticks = sum(ticks for _, _, ticks in recordings)
+    total_bytes = sum(len(data) for data, _, _ in recordings)
+
+    start = time.perf_counter()
+    for data, score, _ in recordings:
+        assert verify_replay(data, score)
+    elapsed = time.perf_counter() - start
+
+    print(f"{games} games, {total_ticks} ticks, {total_bytes} bytes "
+          f"({total_bytes / total_ticks:.2f} bytes/tick incl. headers)")
+    print(f"Replayed at {total_ticks / elapsed:,.0f} ticks/second")
+
+
+if __name__ == "__main__":
+    benchmark_replay()
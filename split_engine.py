@@ -0,0 +1,140 @@
+import argparse
+import time
+
+import numpy as np
+
+# Vectorized expense splitting (day2_expensetracker.py). One entry per person
+# in NumPy arrays: contributions in cents and split weights. Shares, balances,
+# the total check and the creditor/debtor partitions are each one array
+# operation, so a million-person cost allocation takes milliseconds.
+# weighted_shares() is the one split rule for the app: settlement.split_cents
+# and the trip ledger both call it.
+
+WEIGHT_SCALE = 1000  # Weights are exact to 1/1000 (e.g. 1.5 or 0.333)
+INT64_MAX = np.iinfo(np.int64).max
+
+
+def to_cents_array(amounts):
+    """Dollar amounts -> int64 cents, rounding half up like pricing.to_cents
+
+    Rounding to a millionth of a cent first absorbs the float error in the
+    product (1.005 * 100 is 100.49999999999999), so 1.005 -> 101 as with Decimal.
+    """
+    cents = np.round(np.asarray(amounts, dtype=np.float64) * 100, 6)
+    return (np.sign(cents) * np.floor(np.abs(cents) + 0.5)).astype(np.int64)
+
+
+def weighted_shares(total_cents, weights=None, count=None):
+    """Split total_cents by weight (equal if weights is None); shares add up exactly
+
+    Odd cents go to the largest remainders, earliest person first on ties.
+    """
+    if weights is None:
+        base, extra = divmod(total_cents, count)
+        return base + (np.arange(count) < extra)
+
+    scaled = np.floor(np.asarray(weights, dtype=np.float64) * WEIGHT_SCALE + 0.5).astype(np.int64)
+    if (scaled < 0).any():
+        raise ValueError("Weights can't be negative")
+    total_weight = int(scaled.sum())
+    if total_weight == 0:
+        raise ValueError("Weights must add up to more than zero")
+    if total_cents * int(scaled.max()) > INT64_MAX:
+        raise ValueError("Amount too large to split exactly")
+
+    shares, remainders = np.divmod(total_cents * scaled, total_weight)
+    leftover = total_cents - int(shares.sum())
+    if leftover:
+        shares[np.argsort(-remainders, kind='stable')[:leftover]] += 1
+    return shares
+
+
+class Split:
+    """Shares, balances and who pays/receives for one group"""
+
+    def __init__(self, contributions_cents, total_cents, weights=None):
+        self.contributions = np.asarray(contributions_cents, dtype=np.int64)
+        self.total_cents = total_cents
+        self.contributed_cents = int(self.contributions.sum())
+        self.shares = weighted_shares(total_cents, weights, len(self.contributions))
+        self.balances = self.contributions - self.shares  # Positive: owed money
+        self.creditors = np.flatnonzero(self.balances > 0)
+        self.debtors = np.flatnonzero(self.balances < 0)
+
+    @property
+    def matches_total(self):
+        return self.contributed_cents == self.total_cents
+
+
+def legacy_balances(contributions, total_amount):
+    """The app's previous float loop, kept for the benchmark"""
+    fair_share = total_amount / len(contributions)
+    balances = []
+    total_contributed = sum(person["contribution"] for person in contributions)
+    for person in contributions:
+        balances.append({
+            "name": person["name"],
+            "contributed": person["contribution"],
+            "fair_share": fair_share,
+            "balance": person["contribution"] - fair_share,
+        })
+    creditors = [b for b in balances if b["balance"] > 0]
+    debtors = [b for b in balances if b["balance"] < 0]
+    return abs(total_contributed - total_amount) <= 0.01, creditors, debtors
+
+
+def benchmark(people, seed=0, with_settlement=False):
+    rng = np.random.default_rng(seed)
+    contributions = np.where(rng.random(people) < 0.3, rng.integers(1_000, 100_000, people), 0)
+    weights = rng.choice([0.5, 1.0, 1.0, 1.5, 2.0], people)
+    total_cents = int(contributions.sum())
+    dollars = contributions / 100  # What the app's grid holds
+
+    records = [{"name": f"Person {i}", "contribution": amount}
+               for i, amount in enumerate(dollars.tolist())]
+    start = time.perf_counter()
+    legacy_balances(records, total_cents / 100)
+    legacy_seconds = time.perf_counter() - start
+
+    # The app pays for the dollars -> cents conversion on every calculation
+    start = time.perf_counter()
+    cents = to_cents_array(dollars)
+    convert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    split = Split(cents, total_cents)
+    equal_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    weighted = Split(cents, total_cents, weights)
+    weighted_seconds = time.perf_counter() - start
+
+    assert (cents == contributions).all()
+    assert split.matches_total and int(split.balances.sum()) == 0 and int(weighted.balances.sum()) == 0
+    print(f"{people:,} participants")
+    print(f"  python loop (equal split):  {legacy_seconds * 1000:9.1f} ms")
+    print(f"  to_cents_array:             {convert_seconds * 1000:9.1f} ms")
+    print(f"  Split (equal):              {equal_seconds * 1000:9.1f} ms   "
+          f"({(convert_seconds + equal_seconds) * 1000:.1f} ms with conversion)")
+    print(f"  Split (weighted):           {weighted_seconds * 1000:9.1f} ms   "
+          f"({(convert_seconds + weighted_seconds) * 1000:.1f} ms with conversion)")
+
+    if with_settlement:
+        from settlement import settle
+
+        start = time.perf_counter()
+        transfers = settle(weighted.balances.tolist())
+        print(f"  settle() weighted balances: {(time.perf_counter() - start) * 1000:9.1f} ms "
+              f"({len(transfers):,} transfers)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized split benchmark")
+    parser.add_argument('--people', type=int, default=1_000_000)
+    parser.add_argument('--settle', action='store_true', help="also time the settlement engine")
+    args = parser.parse_args()
+    benchmark(args.people, with_settlement=args.settle)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import math
+import time
+from array import array
+
+# Stopwatch timing core.
+# Uses time.perf_counter_ns(), which is monotonic (unaffected by NTP or
+# wall-clock changes) and the highest-resolution clock available, and keeps
+# all accumulated time as integer nanoseconds so repeated start/stop cycles
+# never pick up float rounding drift.
+
+NS_PER_MS = 1_000_000
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MINUTE = 60 * NS_PER_SECOND
+
+
+def format_time(nanoseconds):
+    """Format integer nanoseconds into MM:SS.mmm format"""
+    minutes, remainder = divmod(nanoseconds, NS_PER_MINUTE)
+    seconds, remainder = divmod(remainder, NS_PER_SECOND)
+    return f"{minutes:02d}:{seconds:02d}.{remainder // NS_PER_MS:03d}"
+
+
+class LapLog:
+    """Lap times in compact arrays, with streaming split statistics
+
+    Keeps the total elapsed time and the split (time since the previous lap)
+    of each lap. With a capacity it becomes a ring buffer holding only the most
+    recent laps; fastest/slowest/mean/stddev always cover every lap, kept up to
+    date with Welford's algorithm.
+    """
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.totals = array('q')
+        self.splits = array('q')
+        self.count = 0  # Laps recorded, including any dropped from the buffer
+        self.last_total_ns = 0
+        self.mean_ns = 0.0
+        self.m2 = 0.0
+        self.fastest = None  # (split ns, lap number)
+        self.slowest = None
+
+    def __len__(self):
+        return len(self.totals)
+
+    def add(self, total_ns):
+        """Record a lap at total_ns elapsed; return its split"""
+        split_ns = total_ns - self.last_total_ns
+        self.last_total_ns = total_ns
+
+        if self.capacity is None or len(self.totals) < self.capacity:
+            self.totals.append(total_ns)
+            self.splits.append(split_ns)
+        else:
+            slot = self.count % self.capacity
+            self.totals[slot] = total_ns
+            self.splits[slot] = split_ns
+        self.count += 1
+
+        # Welford update
+        delta = split_ns - self.mean_ns
+        self.mean_ns += delta / self.count
+        self.m2 += delta * (split_ns - self.mean_ns)
+
+        if self.fastest is None or split_ns < self.fastest[0]:
+            self.fastest = (split_ns, self.count)
+        if self.slowest is None or split_ns > self.slowest[0]:
+            self.slowest = (split_ns, self.count)
+        return split_ns
+
+    @property
+    def stddev_ns(self):
+        """Sample standard deviation of the splits"""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def _slot(self, age):
+        """Array index of the lap `age` laps before the newest"""
+        return (self.count - 1 - age) % len(self.totals)
+
+    def newest_first(self):
+        """Yield (lap number, split ns, total ns) for the retained laps, newest first"""
+        for age in range(len(self.totals)):
+            slot = self._slot(age)
+            yield self.count - age, self.splits[slot], self.totals[slot]
+
+    def recent_splits(self):
+        """Retained splits, oldest first (for charting)"""
+        return [self.splits[self._slot(age)] for age in range(len(self.totals) - 1, -1, -1)]
+
+
+class Stopwatch:
+    """Start/stop/lap stopwatch with integer-nanosecond accumulation"""
+
+    def __init__(self, clock=time.perf_counter_ns, lap_capacity=None):
+        self.clock = clock
+        self.lap_capacity = lap_capacity
+        self.reset()
+
+    def reset(self):
+        self.accumulated_ns = 0
+        self.started_at_ns = None
+        self.laps = LapLog(self.lap_capacity)
+
+    @property
+    def is_running(self):
+        return self.started_at_ns is not None
+
+    def start(self):
+        if not self.is_running:
+            self.started_at_ns = self.clock()
+
+    def stop(self):
+        if self.is_running:
+            self.accumulated_ns += self.clock() - self.started_at_ns
+            self.started_at_ns = None
+
+    def elapsed_ns(self):
+        """Total running time so far, in nanoseconds"""
+        if self.is_running:
+            return self.accumulated_ns + self.clock() - self.started_at_ns
+        return self.accumulated_ns
+
+    @property
+    def elapsed(self):
+        """Total running time in seconds (float, for display only)"""
+        return self.elapsed_ns() / NS_PER_SECOND
+
+    def lap(self):
+        """Record and return the current elapsed time"""
+        lap_ns = self.elapsed_ns()
+        self.laps.add(lap_ns)
+        return lap_ns
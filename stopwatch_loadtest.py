@@ -0,0 +1,93 @@
+import argparse
+import time
+
+from streamlit.testing.v1 import AppTest
+
+# Load test for day14_stopwatch.py.
+# Starts several stopwatches, leaves them running and measures the server CPU
+# spent until they are stopped. Both modes drive the real app with the same
+# sessions, duration and clicks (and, with --lap-interval, a lap per
+# stopwatch at that cadence). "polling" replays what the app used to do on
+# top of that: rerun the whole script every 100 ms per open stopwatch.
+# "browser ticker" is the current app, where the display ticks client-side
+# and the script only runs on button clicks.
+
+APP = 'day14_stopwatch.py'
+OLD_POLL_INTERVAL = 0.1
+
+
+def click(at, label):
+    """Press the button whose label contains `label` and rerun the script"""
+    next(button for button in at.button if label in button.label).click().run()
+
+
+def start_stopwatch():
+    """Open a session and press Start"""
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.run()
+    click(at, 'Start')
+    return at
+
+
+def measure(sessions, seconds, poll_interval=None, lap_interval=None):
+    """Return (CPU seconds, script runs) while `sessions` stopwatches run
+
+    Script runs include the final Stop clicks; without polling or laps those
+    are the only runs.
+    """
+    apps = [start_stopwatch() for _ in range(sessions)]
+    runs = 0
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    wall_end = wall_start + seconds
+    next_poll = wall_start + poll_interval if poll_interval else float('inf')
+    next_lap = wall_start + lap_interval if lap_interval else float('inf')
+    while True:
+        time.sleep(max(0.0, min(next_poll, next_lap, wall_end) - time.perf_counter()))
+        now = time.perf_counter()
+        if now >= wall_end:
+            break
+        lap_due = now >= next_lap
+        for at in apps:
+            if lap_due:
+                click(at, 'Lap')  # Also stands in for a poll that is due
+            else:
+                at.run()
+            runs += 1
+        # Stay on the fixed schedule; runs that can't keep up are skipped
+        while next_lap <= now:
+            next_lap += lap_interval
+        while next_poll <= now:
+            next_poll += poll_interval
+    for at in apps:
+        click(at, 'Stop')
+        runs += 1
+    return time.process_time() - cpu_start, runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stopwatch server CPU load test")
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--lap-interval', type=float, help="also record a lap every N seconds per stopwatch")
+    args = parser.parse_args()
+
+    results = {
+        'polling (old)': measure(args.sessions, args.seconds, OLD_POLL_INTERVAL, args.lap_interval),
+        'browser ticker': measure(args.sessions, args.seconds, lap_interval=args.lap_interval),
+    }
+
+    laps = f", a lap every {args.lap_interval:g}s" if args.lap_interval else ""
+    print(f"{args.sessions} running stopwatches for {args.seconds:.0f}s{laps}")
+    for name, (cpu, runs) in results.items():
+        per_stopwatch = cpu / args.sessions / args.seconds
+        print(f"{name:>15}: {runs:6d} script runs, {per_stopwatch * 1000:9.3f} ms CPU per stopwatch per second")
+
+    old_cpu, new_cpu = results['polling (old)'][0], results['browser ticker'][0]
+    if new_cpu > 0:
+        print(f"CPU reduced {old_cpu / new_cpu:,.0f}×")
+
+
+if __name__ == "__main__":
+    main()
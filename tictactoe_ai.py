@@ -0,0 +1,155 @@
+import os
+import pickle
+import random
+
+from tictactoe_engine import Board, CELL_BITS, FULL_MASK, has_win
+
+# Perfect-play tic-tac-toe.
+# Every reachable position is solved once into a transposition table keyed by
+# its canonical (symmetry-reduced) form, so picking a move is a single lookup.
+
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tictactoe_table.pkl')
+TABLE_VERSION = 2
+
+# Probability of playing the optimal move at each difficulty
+DIFFICULTY_LEVELS = {
+    'Easy': 0.0,
+    'Medium': 0.5,
+    'Hard': 0.85,
+    'Unbeatable': 1.0,
+}
+
+
+def _build_symmetries():
+    """The 8 rotations/reflections of the board as cell permutations"""
+    def rotate(r, c):
+        return c, 2 - r
+
+    symmetries = []
+    for reflect in (False, True):
+        for turns in range(4):
+            perm = []
+            for i in range(9):
+                r, c = divmod(i, 3)
+                if reflect:
+                    c = 2 - c
+                for _ in range(turns):
+                    r, c = rotate(r, c)
+                perm.append(r * 3 + c)
+            symmetries.append(tuple(perm))
+    return symmetries
+
+
+# Transformed cell i is original cell perm[i]
+SYMMETRIES = _build_symmetries()
+
+# SYMMETRY_TABLES[s][mask] is mask under symmetry s, so transforming a
+# bitboard is one list index per player instead of a loop over cells
+SYMMETRY_TABLES = [
+    [sum(1 << i for i in range(9) if mask >> perm[i] & 1) for mask in range(512)]
+    for perm in SYMMETRIES
+]
+
+
+def canonical(x, o):
+    """Return the canonical key of a position and the symmetry index producing it"""
+    return min((t[x] | t[o] << 9, s) for s, t in enumerate(SYMMETRY_TABLES))
+
+
+def solve_all():
+    """Solve the full game tree into {canonical key: (value, best cells)}
+
+    Values are from the point of view of the player to move: positive wins,
+    zero draws, negative loses, with larger magnitudes for quicker results.
+    Every position needs an exact value, so this is a memoized full minimax;
+    alpha-beta cut-offs would only leave bounds in the table.
+    """
+    table = {}
+
+    def search(mover, other, moves):
+        # mover/other are the masks of the player to move and their opponent;
+        # the key keeps X in the low bits whichever side is moving
+        x, o = (mover, other) if moves % 2 == 0 else (other, mover)
+        key, _ = canonical(x, o)
+        if key in table:
+            return table[key][0]
+
+        if has_win(other):
+            value, cells = -(10 - moves), ()
+        elif moves == 9:
+            value, cells = 0, ()
+        else:
+            # Search the canonical orientation so stored cells match the key
+            cx, co = key & FULL_MASK, key >> 9
+            mover, other = (cx, co) if moves % 2 == 0 else (co, cx)
+            free = ~(cx | co) & FULL_MASK
+            value = None
+            cells = []
+            for i in range(9):
+                if not free >> i & 1:
+                    continue
+                child = -search(other, mover | CELL_BITS[i], moves + 1)
+                if value is None or child > value:
+                    value, cells = child, [i]
+                elif child == value:
+                    cells.append(i)
+            cells = tuple(cells)
+
+        table[key] = (value, cells)
+        return value
+
+    search(0, 0, 0)
+    return table
+
+
+def load_table(path=TABLE_FILE):
+    """Load the solved table from disk, solving and saving it if needed"""
+    try:
+        with open(path, 'rb') as f:
+            version, table = pickle.load(f)
+        if version == TABLE_VERSION:
+            return table
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+
+    table = solve_all()
+    try:
+        # Write then rename, so pool workers importing at once never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((TABLE_VERSION, table), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only deployments just solve at import
+    return table
+
+
+TABLE = load_table()
+
+
+def _as_board(board):
+    return board if isinstance(board, Board) else Board.from_rows(board)
+
+
+def best_moves(board):
+    """Return all optimal (row, col) moves for the player to move"""
+    board = _as_board(board)
+    key, s = canonical(board.x, board.o)
+    _, cells = TABLE[key]
+    perm = SYMMETRIES[s]
+    return [divmod(perm[c], 3) for c in cells]
+
+
+def random_move(board):
+    """Return a random empty cell, or None if the board is full"""
+    empty_cells = _as_board(board).empty_cells()
+    return random.choice(empty_cells) if empty_cells else None
+
+
+def choose_move(board, difficulty='Unbeatable'):
+    """Pick a move, mixing optimal and random play according to difficulty"""
+    if random.random() < DIFFICULTY_LEVELS[difficulty]:
+        moves = best_moves(board)
+        if moves:
+            return random.choice(moves)
+    return random_move(board)
@@ -0,0 +1,168 @@
+# Bitboard tic-tac-toe core.
+# Cell i = row * 3 + col is bit i of a 9-bit mask; each player has one mask.
+
+FULL_MASK = 0x1FF
+
+LINES = [
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6),             # Diagonals
+]
+WIN_MASKS = [(1 << a) | (1 << b) | (1 << c) for a, b, c in LINES]
+
+# Every cell's bit
+CELL_BITS = [1 << i for i in range(9)]
+
+
+def has_win(mask):
+    """Return the first winning line contained in mask, or 0"""
+    for win in WIN_MASKS:
+        if mask & win == win:
+            return win
+    return 0
+
+
+def mask_cells(mask):
+    """List the (row, col) cells set in a mask"""
+    return [divmod(i, 3) for i in range(9) if mask >> i & 1]
+
+
+class Board:
+    """Tic-tac-toe position as two bitmasks plus a move counter"""
+
+    __slots__ = ('x', 'o', 'moves')
+
+    def __init__(self, x=0, o=0, moves=None):
+        self.x = x
+        self.o = o
+        self.moves = bin(x | o).count('1') if moves is None else moves
+
+    @property
+    def occupied(self):
+        return self.x | self.o
+
+    @property
+    def current_player(self):
+        # X always starts
+        return 'X' if self.moves % 2 == 0 else 'O'
+
+    def copy(self):
+        return Board(self.x, self.o, self.moves)
+
+    def is_empty(self, row, col):
+        return not self.occupied >> (row * 3 + col) & 1
+
+    def play(self, row, col, player=None):
+        """Place a mark; the player defaults to whoever is to move"""
+        bit = CELL_BITS[row * 3 + col]
+        if (player or self.current_player) == 'X':
+            self.x |= bit
+        else:
+            self.o |= bit
+        self.moves += 1
+
+    def winner(self):
+        """Return the winner and winning line coordinates"""
+        for player, mask in (('X', self.x), ('O', self.o)):
+            win = has_win(mask)
+            if win:
+                return player, mask_cells(win)
+        return None, []
+
+    def is_full(self):
+        return self.moves == 9
+
+    def empty_cells(self):
+        free = ~self.occupied & FULL_MASK
+        return [divmod(i, 3) for i in range(9) if free >> i & 1]
+
+    def cell(self, row, col):
+        bit = CELL_BITS[row * 3 + col]
+        if self.x & bit:
+            return 'X'
+        if self.o & bit:
+            return 'O'
+        return ''
+
+    def to_rows(self):
+        """The list-of-lists view used by the UI"""
+        return [[self.cell(i, j) for j in range(3)] for i in range(3)]
+
+    @classmethod
+    def from_rows(cls, rows):
+        x = o = 0
+        for i in range(3):
+            for j in range(3):
+                if rows[i][j] == 'X':
+                    x |= CELL_BITS[i * 3 + j]
+                elif rows[i][j] == 'O':
+                    o |= CELL_BITS[i * 3 + j]
+        return cls(x, o)
+
+
+# Game rules, independent of Streamlit.
+# `state` is anything with board/current_player/game_over/winner/winning_line
+# attributes: a GameState, or st.session_state in the app.
+
+class GameState:
+    """A whole game: the board plus whose turn it is and how it ended"""
+
+    __slots__ = ('board', 'current_player', 'game_over', 'winner', 'winning_line')
+
+    def __init__(self, board=None):
+        self.board = Board() if board is None else board
+        self.current_player = 'X'
+        self.game_over = False
+        self.winner = None
+        self.winning_line = []
+
+
+def check_winner(board):
+    """Check for a winner and return the winner and winning line coordinates"""
+    return board.winner()
+
+
+def is_board_full(board):
+    """Check if the board is full"""
+    return board.is_full()
+
+
+def _place(state, row, col, player):
+    """Place a mark and settle the game if it ended; return True if it did"""
+    state.board.play(row, col, player)
+
+    winner, winning_line = check_winner(state.board)
+    if winner:
+        state.winner = winner
+        state.winning_line = winning_line
+        state.game_over = True
+    elif is_board_full(state.board):
+        state.game_over = True
+        state.winner = "Tie"
+    return state.game_over
+
+
+def make_move(state, row, col, computer=None):
+    """Play (row, col) for the current player; return False if the move is illegal
+
+    Without `computer` the turn passes to the other player. With it, the
+    computer (a function board -> (row, col)) immediately replies as O.
+    """
+    if state.game_over or not state.board.is_empty(row, col):
+        return False
+
+    if _place(state, row, col, state.current_player):
+        return True
+
+    if computer is None:
+        state.current_player = 'O' if state.current_player == 'X' else 'X'
+    elif state.current_player == 'X':
+        state.current_player = 'O'
+        apply_computer_move(state, computer(state.board))
+    return True
+
+
+def apply_computer_move(state, move):
+    """Play the computer's (O's) reply and hand the turn back to X"""
+    if move and not state.game_over and not _place(state, move[0], move[1], 'O'):
+        state.current_player = 'X'
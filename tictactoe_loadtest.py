@@ -0,0 +1,118 @@
+import argparse
+import multiprocessing
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from gomoku_engine import BOARD_VARIANTS, GridBoard, choose_grid_move, seed_worker
+from tictactoe_ai import choose_move
+from tictactoe_engine import Board, GameState, apply_computer_move, make_move
+
+# Load test for the "vs Computer" turn handler.
+# Many players click at once while a fixed pool of server threads runs their
+# turns, like script runs on a Streamlit server. The old handler slept 0.5s
+# per turn on the server thread. "inline" computes the reply on the server
+# thread with no sleep, as the app does for 3×3 boards. "process pool" is the
+# app's path for searches: the click submits the move to worker processes and
+# returns, and the player's fragment polls the future every 0.25s (each poll
+# is another request on the server pool) until the move can be applied.
+
+OLD_THINKING_DELAY = 0.5
+POLL_INTERVAL = 0.25  # day12_tictactoe.poll_computer_move's run_every
+SEARCH_TIME_BUDGET = 0.05
+
+
+def new_board(variant):
+    size, k = BOARD_VARIANTS[variant]
+    return Board() if (size, k) == (3, 3) else GridBoard(size, k)
+
+
+def computer_move(board):
+    """The computer's reply, as the app picks it at the strongest level"""
+    if isinstance(board, GridBoard):
+        return choose_grid_move(board, 1.0, SEARCH_TIME_BUDGET)
+    return choose_move(board, 'Unbeatable')
+
+
+def blocking_turn(state, row, col):
+    """The previous handler: sleep on the server thread, then reply"""
+    def computer(board):
+        move = computer_move(board)
+        time.sleep(OLD_THINKING_DELAY)
+        return move
+    make_move(state, row, col, computer)
+
+
+def inline_turn(state, row, col):
+    """Reply straight away on the server thread"""
+    if make_move(state, row, col) and not state.game_over:
+        apply_computer_move(state, computer_move(state.board))
+
+
+def pooled_turn(search_pool, state, row, col):
+    """Submit the reply to the worker processes; return the pending future"""
+    if make_move(state, row, col) and not state.game_over:
+        return search_pool.submit(computer_move, state.board)
+    return None
+
+
+def poll_turn(state, future):
+    """One fragment run: apply the move if it is ready, else keep waiting"""
+    if not future.done():
+        return future
+    apply_computer_move(state, future.result())
+    return None
+
+
+def play_session(handler, pool, variant, latencies):
+    """One player's game: each click (and each poll) is a request queued on the shared server pool"""
+    state = GameState(new_board(variant))
+    while not state.game_over:
+        row, col = state.board.empty_cells()[0]
+        submitted = time.perf_counter()
+        pending = pool.submit(handler, state, row, col).result()
+        while pending is not None:
+            time.sleep(POLL_INTERVAL)
+            pending = pool.submit(poll_turn, state, pending).result()
+        latencies.append(time.perf_counter() - submitted)
+
+
+def run(handler, players, server_threads, variant):
+    """Return (turns per second, p50 latency, p95 latency) for one handler"""
+    latencies = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=server_threads) as server, \
+            ThreadPoolExecutor(max_workers=players) as clients:
+        sessions = [clients.submit(play_session, handler, server, variant, latencies) for _ in range(players)]
+        for session in sessions:
+            session.result()
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=20)
+    return len(latencies) / elapsed, quantiles[9], quantiles[18]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent tic-tac-toe turn load test")
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--server-threads', type=int, default=8)
+    parser.add_argument('--variant', choices=list(BOARD_VARIANTS), default='Classic 3×3')
+    args = parser.parse_args()
+
+    print(f"{args.players} concurrent players, {args.server_threads} server threads, {args.variant}")
+    # Same pool setup as day12_tictactoe.get_search_pool
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'), initializer=seed_worker) as search_pool:
+        handlers = (
+            ('blocking (old)', blocking_turn),
+            ('inline', inline_turn),
+            ('process pool', partial(pooled_turn, search_pool)),
+        )
+        for name, handler in handlers:
+            turns_per_second, p50, p95 = run(handler, args.players, args.server_threads, args.variant)
+            print(f"{name:>15}: {turns_per_second:10,.0f} turns/s   "
+                  f"p50 {p50 * 1000:8.2f} ms   p95 {p95 * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from tictactoe_ai import best_moves, choose_move, random_move
+from tictactoe_engine import CELL_BITS, FULL_MASK, GameState, WIN_MASKS, make_move
+
+# Headless self-play: pits tic-tac-toe strategies against each other across a
+# process pool and reports win/draw/loss tables and games per second.
+
+
+def greedy_move(board):
+    """Win if possible, otherwise block, otherwise play randomly"""
+    mover, other = (board.x, board.o) if board.current_player == 'X' else (board.o, board.x)
+    free = ~board.occupied & FULL_MASK
+    for mask in (mover, other):
+        for i in range(9):
+            if free >> i & 1:
+                bit = CELL_BITS[i]
+                if any((mask | bit) & win == win for win in WIN_MASKS):
+                    return divmod(i, 3)
+    return random_move(board)
+
+
+def perfect_move(board):
+    return random.choice(best_moves(board))
+
+
+# Strategy name -> function(board) -> (row, col)
+STRATEGIES = {
+    'random': random_move,
+    'greedy': greedy_move,
+    'medium': lambda board: choose_move(board, 'Medium'),
+    'hard': lambda board: choose_move(board, 'Hard'),
+    'perfect': perfect_move,
+}
+
+
+def play_game(strategy_x, strategy_o):
+    """Play one game through the pure engine and return 'X', 'O' or 'Tie'"""
+    state = GameState()
+    strategies = {'X': strategy_x, 'O': strategy_o}
+    while not state.game_over:
+        row, col = strategies[state.current_player](state.board)
+        make_move(state, row, col)
+    return state.winner
+
+
+def play_batch(x_name, o_name, games, seed):
+    """Worker entry point: play a batch and return (x wins, o wins, ties)"""
+    random.seed(seed)
+    strategy_x, strategy_o = STRATEGIES[x_name], STRATEGIES[o_name]
+    results = {'X': 0, 'O': 0, 'Tie': 0}
+    for _ in range(games):
+        results[play_game(strategy_x, strategy_o)] += 1
+    return x_name, o_name, results['X'], results['O'], results['Tie']
+
+
+def run_tournament(names, games_per_pairing, workers=None, batch_size=10_000, seed=0):
+    """Play every ordered pairing; return ({(x, o): [x wins, o wins, ties]}, games/sec)"""
+    jobs = []
+    for x_name, o_name in product(names, repeat=2):
+        remaining = games_per_pairing
+        while remaining > 0:
+            batch = min(batch_size, remaining)
+            jobs.append((x_name, o_name, batch, seed + len(jobs)))
+            remaining -= batch
+
+    totals = {pairing: [0, 0, 0] for pairing in product(names, repeat=2)}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for x_name, o_name, x_wins, o_wins, ties in pool.map(play_batch, *zip(*jobs)):
+            counts = totals[(x_name, o_name)]
+            counts[0] += x_wins
+            counts[1] += o_wins
+            counts[2] += ties
+    elapsed = time.perf_counter() - start
+
+    total_games = games_per_pairing * len(totals)
+    return totals, total_games / elapsed
+
+
+def print_report(totals, games_per_second):
+    """Print a W/D/L table from X's point of view for each pairing"""
+    print(f"{'X':>10} {'O':>10} {'X win %':>9} {'Draw %':>8} {'O win %':>9}")
+    for (x_name, o_name), (x_wins, o_wins, ties) in totals.items():
+        games = x_wins + o_wins + ties
+        print(f"{x_name:>10} {o_name:>10} "
+              f"{100 * x_wins / games:>8.1f}% {100 * ties / games:>7.1f}% {100 * o_wins / games:>8.1f}%")
+    print(f"\n{games_per_second:,.0f} games/second")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tic-tac-toe self-play tournament")
+    parser.add_argument('--games', type=int, default=100_000, help="games per pairing")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--strategies', nargs='+', default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    totals, games_per_second = run_tournament(args.strategies, args.games, args.workers, seed=args.seed)
+    print_report(totals, games_per_second)
+
+
+if __name__ == "__main__":
+    main()
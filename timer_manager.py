@@ -0,0 +1,198 @@
+import heapq
+import struct
+import threading
+import time
+
+from stopwatch_core import NS_PER_SECOND
+
+# Many named stopwatches and countdown timers for one deployment (e.g. interval
+# timers on every station of a gym). Running countdowns sit in a min-heap keyed
+# by expiry time, so finding or popping the next alarm is O(log n) however many
+# timers exist. Pausing or resetting a countdown gives it a new generation
+# (unique across the manager) instead of searching the heap; stale heap
+# entries are skipped when they surface.
+
+STOPWATCH, COUNTDOWN = 0, 1
+RUNNING, FIRED = 1, 2  # Flag bits
+
+# kind, flags, generation, accumulated ns (elapsed for stopwatches, used-up time
+# for countdowns), started-at ns (0 when paused), duration ns (countdowns only)
+TIMER_STRUCT = struct.Struct('<BBIqqq')
+NAME_LENGTH = struct.Struct('<H')
+
+
+class TimerState:
+    """Compact state of one timer; packs into TIMER_STRUCT.size (30) bytes"""
+
+    __slots__ = ('kind', 'flags', 'generation', 'accumulated_ns', 'started_at_ns', 'duration_ns')
+
+    def __init__(self, kind, duration_ns=0):
+        self.kind = kind
+        self.flags = 0
+        self.generation = 0
+        self.accumulated_ns = 0
+        self.started_at_ns = 0
+        self.duration_ns = duration_ns
+
+    @property
+    def is_running(self):
+        return bool(self.flags & RUNNING)
+
+    @property
+    def has_fired(self):
+        return bool(self.flags & FIRED)
+
+    def pack(self):
+        return TIMER_STRUCT.pack(self.kind, self.flags, self.generation,
+                                 self.accumulated_ns, self.started_at_ns, self.duration_ns)
+
+    @classmethod
+    def unpack(cls, data, offset=0):
+        state = cls.__new__(cls)
+        (state.kind, state.flags, state.generation, state.accumulated_ns,
+         state.started_at_ns, state.duration_ns) = TIMER_STRUCT.unpack_from(data, offset)
+        return state
+
+
+class TimerManager:
+    """Named stopwatches and countdowns with heap-scheduled alarms"""
+
+    def __init__(self, clock=time.monotonic_ns):
+        # monotonic_ns rather than perf_counter_ns: it is system-wide, so
+        # serialized start times stay meaningful in another process
+        self.clock = clock
+        self.timers = {}
+        self.alarms = []  # (due ns, generation, name)
+        self.last_generation = 0
+        self.lock = threading.RLock()
+
+    def _new_generation(self, timer):
+        # Unique per manager, so a removed and re-added name can't match old entries
+        self.last_generation += 1
+        timer.generation = self.last_generation
+
+    # Creating and removing
+    def add_stopwatch(self, name):
+        with self.lock:
+            self._check_new(name)
+            self.timers[name] = TimerState(STOPWATCH)
+
+    def add_countdown(self, name, seconds):
+        with self.lock:
+            self._check_new(name)
+            self.timers[name] = TimerState(COUNTDOWN, int(seconds * NS_PER_SECOND))
+
+    def _check_new(self, name):
+        if name in self.timers:
+            raise ValueError(f"A timer named '{name}' already exists")
+
+    def remove(self, name):
+        with self.lock:
+            del self.timers[name]  # Its heap entry is skipped once it surfaces
+
+    # Controls
+    def start(self, name):
+        with self.lock:
+            timer = self.timers[name]
+            if timer.is_running or timer.has_fired:
+                return
+            timer.flags |= RUNNING
+            timer.started_at_ns = self.clock()
+            if timer.kind == COUNTDOWN:
+                self._new_generation(timer)
+                due = timer.started_at_ns + timer.duration_ns - timer.accumulated_ns
+                heapq.heappush(self.alarms, (due, timer.generation, name))
+
+    def pause(self, name):
+        with self.lock:
+            timer = self.timers[name]
+            if not timer.is_running:
+                return
+            timer.accumulated_ns += self.clock() - timer.started_at_ns
+            timer.started_at_ns = 0
+            timer.flags &= ~RUNNING
+            self._new_generation(timer)  # Invalidates the pending alarm
+
+    def reset(self, name):
+        with self.lock:
+            timer = self.timers[name]
+            timer.flags = 0
+            timer.accumulated_ns = 0
+            timer.started_at_ns = 0
+            self._new_generation(timer)
+
+    # Reading
+    def elapsed_ns(self, name, now=None):
+        timer = self.timers[name]
+        if timer.is_running:
+            return timer.accumulated_ns + (self.clock() if now is None else now) - timer.started_at_ns
+        return timer.accumulated_ns
+
+    def remaining_ns(self, name, now=None):
+        """Time left on a countdown (0 once it has fired)"""
+        timer = self.timers[name]
+        return max(0, timer.duration_ns - self.elapsed_ns(name, now))
+
+    def _pop_stale(self):
+        """Drop heap entries for timers that were paused, reset or removed"""
+        while self.alarms:
+            _, generation, name = self.alarms[0]
+            timer = self.timers.get(name)
+            if timer is not None and timer.generation == generation and timer.is_running:
+                return
+            heapq.heappop(self.alarms)
+
+    def next_alarm(self):
+        """(due ns, name) of the next countdown to expire, or None"""
+        with self.lock:
+            self._pop_stale()
+            if not self.alarms:
+                return None
+            due, _, name = self.alarms[0]
+            return due, name
+
+    def poll(self, now=None):
+        """Fire every countdown due by `now`; return their names in expiry order"""
+        now = self.clock() if now is None else now
+        fired = []
+        with self.lock:
+            while True:
+                self._pop_stale()
+                if not self.alarms or self.alarms[0][0] > now:
+                    return fired
+                due, _, name = heapq.heappop(self.alarms)
+                timer = self.timers[name]
+                timer.accumulated_ns = timer.duration_ns
+                timer.started_at_ns = 0
+                timer.flags = FIRED
+                self._new_generation(timer)
+                fired.append(name)
+
+    # Serialization
+    def to_bytes(self):
+        """Pack every timer: [name length, name, TIMER_STRUCT] per timer"""
+        with self.lock:
+            parts = []
+            for name, timer in self.timers.items():
+                encoded = name.encode('utf-8')
+                parts.append(NAME_LENGTH.pack(len(encoded)) + encoded + timer.pack())
+            return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data, clock=time.monotonic_ns):
+        manager = cls(clock)
+        offset = 0
+        while offset < len(data):
+            (length,) = NAME_LENGTH.unpack_from(data, offset)
+            offset += NAME_LENGTH.size
+            name = data[offset:offset + length].decode('utf-8')
+            offset += length
+            timer = TimerState.unpack(data, offset)
+            offset += TIMER_STRUCT.size
+            manager.timers[name] = timer
+            manager.last_generation = max(manager.last_generation, timer.generation)
+            if timer.kind == COUNTDOWN and timer.is_running:
+                due = timer.started_at_ns + timer.duration_ns - timer.accumulated_ns
+                manager.alarms.append((due, timer.generation, name))
+        heapq.heapify(manager.alarms)
+        return manager
@@ -0,0 +1,140 @@
+import itertools
+import math
+import random
+import time
+
+from settlement import settle
+from split_engine import weighted_shares
+
+# A trip's worth of shared expenses (day2_expensetracker.py). Each expense has
+# a payer, the people it is split between and optional weights (e.g. 2 for
+# someone who had the double room). Net balances in cents are kept up to date
+# as expenses are added, edited or deleted, touching only the people in that
+# expense, so the settle-up view never has to replay the whole trip.
+
+
+class Expense:
+    __slots__ = ('description', 'payer', 'amount_cents', 'weights')
+
+    def __init__(self, description, payer, amount_cents, weights):
+        self.description = description
+        self.payer = payer
+        self.amount_cents = amount_cents
+        self.weights = weights  # {participant: weight}
+
+
+class TripLedger:
+    """Expenses keyed by id, with incrementally maintained net balances"""
+
+    def __init__(self):
+        self.expenses = {}
+        self.balances = {}  # name -> cents; positive means they are owed money
+        self.ids = itertools.count(1)
+
+    def add_person(self, name):
+        self.balances.setdefault(name, 0)
+
+    @staticmethod
+    def _shares(expense):
+        """{participant: share in cents} for one expense"""
+        participants = list(expense.weights)
+        shares = weighted_shares(expense.amount_cents, [expense.weights[name] for name in participants])
+        return dict(zip(participants, shares.tolist()))
+
+    def _apply(self, expense, shares, sign):
+        """Add (sign=1) or remove (sign=-1) one expense's effect on the balances"""
+        self.add_person(expense.payer)
+        self.balances[expense.payer] += sign * expense.amount_cents
+        for name, share in shares.items():
+            self.add_person(name)
+            self.balances[name] -= sign * share
+
+    @staticmethod
+    def _expense(description, payer, amount_cents, participants, weights):
+        if amount_cents <= 0:
+            raise ValueError("Amount must be greater than zero")
+        if not participants:
+            raise ValueError("An expense needs at least one participant")
+        weights = weights or {}
+        unknown = [name for name in weights if name not in participants]
+        if unknown:
+            raise ValueError(f"Weights given for people not in this expense: {', '.join(unknown)}")
+        if any(not math.isfinite(weights.get(name, 1)) or weights.get(name, 1) <= 0
+               for name in participants):
+            raise ValueError("Weights must be finite numbers greater than zero")
+        return Expense(description, payer, amount_cents,
+                       {name: weights.get(name, 1) for name in participants})
+
+    def add_expense(self, payer, amount_cents, participants, weights=None, description=""):
+        """Record an expense; returns its id"""
+        expense = self._expense(description, payer, amount_cents, participants, weights)
+        shares = self._shares(expense)  # Anything that can fail happens before the ledger changes
+        expense_id = next(self.ids)
+        self.expenses[expense_id] = expense
+        self._apply(expense, shares, 1)
+        return expense_id
+
+    def edit_expense(self, expense_id, payer, amount_cents, participants, weights=None, description=""):
+        expense = self._expense(description, payer, amount_cents, participants, weights)
+        old = self.expenses[expense_id]
+        shares, old_shares = self._shares(expense), self._shares(old)
+        self._apply(old, old_shares, -1)
+        self.expenses[expense_id] = expense
+        self._apply(expense, shares, 1)
+
+    def delete_expense(self, expense_id):
+        expense = self.expenses[expense_id]
+        shares = self._shares(expense)
+        del self.expenses[expense_id]
+        self._apply(expense, shares, -1)
+
+    def total_cents(self):
+        return sum(expense.amount_cents for expense in self.expenses.values())
+
+    def settlement(self):
+        """[(debtor, creditor, cents), ...] settling every balance"""
+        names = list(self.balances)
+        return [(names[debtor], names[creditor], cents)
+                for debtor, creditor, cents in settle([self.balances[name] for name in names])]
+
+    def recompute_balances(self):
+        """Balances replayed from every expense (to check the incremental ones)"""
+        ledger = TripLedger()
+        for name in self.balances:
+            ledger.add_person(name)
+        for expense in self.expenses.values():
+            ledger._apply(expense, ledger._shares(expense), 1)
+        return ledger.balances
+
+
+def benchmark(expenses=2_000, people=12, seed=0):
+    """Time incremental updates on a large trip against replaying every expense"""
+    rng = random.Random(seed)
+    names = [f"Traveler {i + 1}" for i in range(people)]
+    ledger = TripLedger()
+    for _ in range(expenses):
+        participants = rng.sample(names, rng.randint(2, people))
+        weights = {name: rng.choice((1, 1, 1, 2)) for name in participants}
+        ledger.add_expense(rng.choice(names), rng.randint(500, 50_000), participants, weights)
+
+    edits = 1_000
+    start = time.perf_counter()
+    for _ in range(edits):
+        expense_id = rng.choice(list(ledger.expenses))
+        expense = ledger.expenses[expense_id]
+        ledger.edit_expense(expense_id, expense.payer, rng.randint(500, 50_000), list(expense.weights), expense.weights)
+        ledger.settlement()
+    incremental = (time.perf_counter() - start) / edits
+
+    start = time.perf_counter()
+    replayed = ledger.recompute_balances()
+    replay = time.perf_counter() - start
+
+    assert replayed == ledger.balances
+    print(f"{expenses:,} expenses, {people} travelers")
+    print(f"  edit + settle (incremental): {incremental * 1e6:8.1f} µs")
+    print(f"  replaying every expense:     {replay * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    benchmark()